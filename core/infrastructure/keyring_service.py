@@ -43,6 +43,10 @@ class KeyringService:
         """Initialize KeyringService and check availability."""
         self._available: Optional[bool] = None
         self._keyring_module = None
+        # Keyring lookups can hit D-Bus or a locked vault; keep the values we
+        # read, keyed by full credential name. Misses are not cached so keys
+        # added outside the app (OS keychain, another process) show up.
+        self._cred_cache: dict[str, str] = {}
     
     @property
     def is_available(self) -> bool:
@@ -81,6 +85,22 @@ class KeyringService:
         
         return self._available
     
+    def refresh_availability(self) -> bool:
+        """
+        Re-probe the keyring backend.
+
+        is_available probes once and caches the result for the process. Call
+        this when the backend may have changed (e.g., the user unlocked or
+        logged into their session keyring).
+
+        Returns:
+            True if keyring can be used, False otherwise.
+        """
+        self._available = None
+        self._keyring_module = None
+        self._cred_cache.clear()
+        return self.is_available
+
     def _get_keyring(self):
         """Get the keyring module, importing if needed."""
         if self._keyring_module is not None:
@@ -121,6 +141,7 @@ class KeyringService:
             keyring = self._get_keyring()
             credential_name = self._get_credential_name(name)
             keyring.set_password(self.SERVICE_NAME, credential_name, value)
+            self._cred_cache[credential_name] = value
             logger.debug(f"Stored credential: {credential_name}")
             return True
         except Exception as e:
@@ -143,13 +164,18 @@ class KeyringService:
         
         # Try keyring first
         if self.is_available:
-            try:
-                keyring = self._get_keyring()
-                value = keyring.get_password(self.SERVICE_NAME, credential_name)
-                if value:
-                    return value
-            except Exception as e:
-                logger.warning(f"Failed to get credential from keyring: {e}")
+            value = self._cred_cache.get(credential_name)
+            if value is None:
+                try:
+                    keyring = self._get_keyring()
+                    value = keyring.get_password(self.SERVICE_NAME, credential_name)
+                    if value:
+                        self._cred_cache[credential_name] = value
+                except Exception as e:
+                    logger.warning(f"Failed to get credential from keyring: {e}")
+                    value = None
+            if value:
+                return value
         
         # Fall back to environment variable
         normalized_name = name.lower()
@@ -175,9 +201,10 @@ class KeyringService:
         if not self.is_available:
             return False
         
+        credential_name = self._get_credential_name(name)
+        self._cred_cache.pop(credential_name, None)
         try:
             keyring = self._get_keyring()
-            credential_name = self._get_credential_name(name)
             keyring.delete_password(self.SERVICE_NAME, credential_name)
             logger.debug(f"Deleted credential: {credential_name}")
             return True
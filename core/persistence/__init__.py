@@ -1,21 +1,23 @@
 """Persistence package exports."""
 
-from .database import Database
+from .database import Database, get_shared_database
 from .workspace_repository import WorkspaceRepository
 from .session_repository import SessionRepository
 from .message_repository import MessageRepository
 from .message_attachment_repository import MessageAttachmentRepository
 from .artifact_repository import ArtifactRepository
-from .settings_repository import SettingsRepository
+from .settings_repository import SettingsRepository, get_shared_settings_repository
 from .rag_repository import RagRepository
 
 __all__ = [
     "Database",
+    "get_shared_database",
     "WorkspaceRepository",
     "SessionRepository",
     "MessageRepository",
     "MessageAttachmentRepository",
     "ArtifactRepository",
     "SettingsRepository",
+    "get_shared_settings_repository",
     "RagRepository",
 ]
@@ -44,10 +44,19 @@ class ArtifactRepository:
     def __init__(self, database: Database):
         self._db = database
 
+    @property
+    def database(self) -> Database:
+        """Database this repository reads and writes."""
+        return self._db
+
     # ---- Collection-based API ----
 
-    def save_collection(self, session_id: str, collection: ArtifactCollectionV1) -> None:
-        """Save an artifact collection for a session."""
+    def save_collection(self, session_id: str, collection: ArtifactCollectionV1) -> str:
+        """Save an artifact collection for a session.
+
+        Returns:
+            The updated_at timestamp written for the row.
+        """
         payload = collection.model_dump(by_alias=True, mode="json")
         collection_json = json.dumps(payload)
         conn = self._db.get_connection()
@@ -68,6 +77,17 @@ class ArtifactRepository:
             ),
         )
         conn.commit()
+        return now
+
+    def get_updated_at(self, session_id: str) -> Optional[str]:
+        """Get the last-modified timestamp of a session's artifacts, if any."""
+        conn = self._db.get_connection()
+        cursor = conn.execute(
+            "SELECT updated_at FROM artifacts WHERE session_id = ?",
+            (session_id,),
+        )
+        row = cursor.fetchone()
+        return row["updated_at"] if row else None
 
     def get_collection(self, session_id: str) -> Optional[ArtifactCollectionV1]:
         """Get the artifact collection for a session with backward compatibility."""
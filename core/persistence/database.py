@@ -4,13 +4,20 @@ from __future__ import annotations
 
 import sqlite3
 import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 
 class Database:
-    """Unified database manager for the application."""
+    """Unified database manager for the application.
+
+    Connections are per thread: get_connection() opens one lazily for the
+    calling thread, so repositories can be used from worker threads without
+    check_same_thread=False. Workers should call close() when done, since each
+    connection is only reachable from the thread that opened it.
+    """
 
     SCHEMA = """
     PRAGMA foreign_keys = ON;
@@ -149,6 +156,7 @@ class Database:
     CREATE TABLE IF NOT EXISTS settings (
         key TEXT PRIMARY KEY,
         value TEXT NOT NULL,
+        value_int INTEGER,
         category TEXT NOT NULL,
         updated_at TEXT NOT NULL
     );
@@ -172,6 +180,7 @@ class Database:
     def _apply_migrations(self, conn: sqlite3.Connection) -> None:
         self._ensure_rag_document_columns(conn)
         self._ensure_rag_index_registry(conn)
+        self._ensure_settings_columns(conn)
         self._seed_global_workspace(conn)
 
     # Allowlist for migration column validation (Issue #3: Dynamic SQL safety)
@@ -220,6 +229,13 @@ class Database:
             WHERE indexed_at IS NULL
             """
         )
+        # Created here rather than in SCHEMA: stale_at may only exist after migration
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_rag_documents_source_stale
+                ON rag_documents(source_type, stale_at)
+            """
+        )
         if embedding_status_added:
             conn.execute(
                 """
@@ -309,6 +325,14 @@ class Database:
                 """
             )
 
+    def _ensure_settings_columns(self, conn: sqlite3.Connection) -> None:
+        cursor = conn.execute("PRAGMA table_info(settings)")
+        existing = {row["name"] for row in cursor.fetchall()}
+        # Existing rows keep value_int NULL and are read from the TEXT column
+        # until their subsystem next saves them.
+        if "value_int" not in existing:
+            conn.execute("ALTER TABLE settings ADD COLUMN value_int INTEGER")
+
     def _seed_global_workspace(self, conn: sqlite3.Connection) -> None:
         now = datetime.now().isoformat()
         conn.execute(
@@ -326,10 +350,58 @@ class Database:
             self._local.connection.row_factory = sqlite3.Row
             self._local.connection.execute("PRAGMA foreign_keys = ON")
             self._local.connection.execute("PRAGMA journal_mode=WAL")
+            # WAL stays consistent with NORMAL sync; it only skips the fsync
+            # on each commit, not on checkpoints
+            self._local.connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection.execute("PRAGMA temp_store=MEMORY")
+            # Worker-thread connections wait for a writer instead of failing
+            self._local.connection.execute("PRAGMA busy_timeout=5000")
         return self._local.connection
 
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run writes on this thread's connection as a single transaction.
+
+        Commits on success and rolls back on error. Nested uses join the
+        outermost transaction, so callers can group several repository writes
+        into one commit.
+        """
+        conn = self.get_connection()
+        depth = getattr(self._local, "transaction_depth", 0)
+        self._local.transaction_depth = depth + 1
+        try:
+            yield conn
+            # sqlite3 opens the transaction at the first write, so a block
+            # that wrote nothing has nothing to commit
+            if depth == 0 and conn.in_transaction:
+                conn.commit()
+        except BaseException:
+            if depth == 0:
+                conn.rollback()
+            raise
+        finally:
+            self._local.transaction_depth = depth
+
     def close(self) -> None:
         """Close the database connection for the current thread."""
         if hasattr(self._local, "connection") and self._local.connection is not None:
             self._local.connection.close()
             self._local.connection = None
+
+
+# Shared instance for the default database path
+_shared_database: Optional[Database] = None
+
+
+def get_shared_database() -> Database:
+    """
+    Get the process-wide Database for the default path.
+
+    Components that are not handed a Database fall back to this instance, so
+    they share one schema initialization and one connection per thread
+    instead of each opening the same file.
+    """
+    global _shared_database
+    if _shared_database is None:
+        _shared_database = Database()
+    return _shared_database
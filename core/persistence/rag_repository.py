@@ -11,6 +11,8 @@ import uuid
 from .database import Database
 
 GLOBAL_WORKSPACE_ID = "GLOBAL"
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER (999 on older SQLite builds)
+_MAX_SQL_PARAMS = 900
 _FTS_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
 
 
@@ -301,6 +303,34 @@ class RagRepository:
         conn.execute("DELETE FROM rag_documents WHERE id = ?", (document_id,))
         conn.commit()
 
+    def delete_documents(self, document_ids: Iterable[str]) -> None:
+        """Delete several documents (and their FTS rows) in one transaction."""
+        document_ids = list(document_ids)
+        if not document_ids:
+            return
+        conn = self._db.get_connection()
+        try:
+            for start in range(0, len(document_ids), _MAX_SQL_PARAMS):
+                batch = tuple(document_ids[start : start + _MAX_SQL_PARAMS])
+                placeholders = ",".join(["?"] * len(batch))
+                conn.execute(
+                    f"""
+                    DELETE FROM rag_chunks_fts
+                    WHERE chunk_id IN (
+                        SELECT id FROM rag_chunks WHERE document_id IN ({placeholders})
+                    )
+                    """,
+                    batch,
+                )
+                conn.execute(
+                    f"DELETE FROM rag_documents WHERE id IN ({placeholders})",
+                    batch,
+                )
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+
     def mark_session_documents_stale(self, session_id: str, stale_at: datetime) -> None:
         conn = self._db.get_connection()
         conn.execute(
@@ -330,6 +360,33 @@ class RagRepository:
         )
         return [_row_to_document(row) for row in cursor.fetchall()]
 
+    def get_earliest_stale_at(self) -> Optional[datetime]:
+        """Return the oldest stale_at among ChatPDF documents, if any."""
+        conn = self._db.get_connection()
+        cursor = conn.execute(
+            """
+            SELECT MIN(stale_at) AS earliest
+            FROM rag_documents
+            WHERE source_type = 'chatpdf' AND stale_at IS NOT NULL
+            """
+        )
+        row = cursor.fetchone()
+        return _parse_optional_datetime(row["earliest"]) if row else None
+
+    def list_stale_document_refs(self, cutoff: datetime) -> list[tuple[str, Optional[str]]]:
+        """List (id, source_path) of ChatPDF documents stale since before cutoff."""
+        conn = self._db.get_connection()
+        cursor = conn.execute(
+            """
+            SELECT id, source_path
+            FROM rag_documents
+            WHERE source_type = 'chatpdf' AND stale_at IS NOT NULL AND stale_at <= ?
+            ORDER BY stale_at ASC
+            """,
+            (cutoff.isoformat(),),
+        )
+        return [(row["id"], row["source_path"]) for row in cursor.fetchall()]
+
     def attach_document_to_session(self, document_id: str, session_id: str) -> None:
         conn = self._db.get_connection()
         now = datetime.now().isoformat()
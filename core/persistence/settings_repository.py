@@ -2,11 +2,42 @@
 
 from __future__ import annotations
 
+import sqlite3
+import weakref
 from datetime import datetime
-from typing import Optional
+from typing import ContextManager, Iterable, Optional, Union
 
 from core.models import Setting
-from .database import Database
+from .database import Database, get_shared_database
+
+# Stay under SQLite's default bound-parameter limit for IN (...) lookups
+_MAX_SQL_PARAMS = 900
+
+_TRUTHY_VALUES = ("1", "true", "yes", "on")
+_BOOL_STRINGS = {True: "true", False: "false"}
+
+# Value accepted by set()/set_many(). Ints and bools are also stored natively
+# in value_int so loads can skip re-parsing the TEXT form.
+SettingValue = Union[str, int, bool]
+
+_UPSERT_SQL = """
+    INSERT INTO settings (key, value, value_int, category, updated_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(key) DO UPDATE SET
+        value = excluded.value,
+        value_int = excluded.value_int,
+        category = excluded.category,
+        updated_at = excluded.updated_at
+"""
+
+
+def _to_columns(value: SettingValue) -> tuple[str, Optional[int]]:
+    """Split a value into its (value, value_int) column pair."""
+    if value is True or value is False:
+        return _BOOL_STRINGS[value], int(value)
+    if isinstance(value, int):
+        return str(value), value
+    return value, None
 
 
 class SettingsRepository:
@@ -15,6 +46,10 @@ class SettingsRepository:
     def __init__(self, database: Database):
         self._db = database
 
+    def transaction(self) -> ContextManager[sqlite3.Connection]:
+        """Group several writes into one commit (see Database.transaction)."""
+        return self._db.transaction()
+
     def get(self, key: str) -> Optional[Setting]:
         conn = self._db.get_connection()
         cursor = conn.execute(
@@ -62,27 +97,49 @@ class SettingsRepository:
             for row in cursor.fetchall()
         ]
 
-    def set(self, key: str, value: str, category: str) -> Setting:
+    def get_values(self, keys: Iterable[str]) -> dict[str, Union[str, int]]:
+        """Fetch the stored values for keys in one query; missing keys are omitted.
+
+        Rows written with an int or bool value come back as int; everything
+        else (including rows saved before value_int existed) comes back as the
+        TEXT form, which parse_int()/parse_bool() still understand.
+        """
+        keys = list(keys)
         conn = self._db.get_connection()
+        values: dict[str, Union[str, int]] = {}
+        for start in range(0, len(keys), _MAX_SQL_PARAMS):
+            batch = keys[start : start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            cursor = conn.execute(
+                f"SELECT key, COALESCE(value_int, value) AS value FROM settings "
+                f"WHERE key IN ({placeholders})",
+                batch,
+            )
+            values.update((row["key"], row["value"]) for row in cursor.fetchall())
+        return values
+
+    def set(self, key: str, value: SettingValue, category: str) -> Setting:
         now = datetime.now()
-        conn.execute(
-            """
-            INSERT INTO settings (key, value, category, updated_at)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(key) DO UPDATE SET
-                value = excluded.value,
-                category = excluded.category,
-                updated_at = excluded.updated_at
-            """,
-            (key, value, category, now.isoformat()),
-        )
-        conn.commit()
-        return Setting(key=key, value=value, category=category, updated_at=now)
+        text, number = _to_columns(value)
+        with self._db.transaction() as conn:
+            conn.execute(_UPSERT_SQL, (key, text, number, category, now.isoformat()))
+        return Setting(key=key, value=text, category=category, updated_at=now)
+
+    def set_many(self, entries: Iterable[tuple[str, SettingValue, str]]) -> None:
+        """Upsert several (key, value, category) rows with a single commit."""
+        now = datetime.now().isoformat()
+        rows = [
+            (key, *_to_columns(value), category, now)
+            for key, value, category in entries
+        ]
+        if not rows:
+            return
+        with self._db.transaction() as conn:
+            conn.executemany(_UPSERT_SQL, rows)
 
     def delete(self, key: str) -> bool:
-        conn = self._db.get_connection()
-        cursor = conn.execute("DELETE FROM settings WHERE key = ?", (key,))
-        conn.commit()
+        with self._db.transaction() as conn:
+            cursor = conn.execute("DELETE FROM settings WHERE key = ?", (key,))
         return cursor.rowcount > 0
 
     def get_value(self, key: str, default: str = "") -> str:
@@ -90,12 +147,49 @@ class SettingsRepository:
         return setting.value if setting else default
 
     def get_int(self, key: str, default: int = 0) -> int:
-        value = self.get_value(key, str(default))
+        return self.parse_int(self.get_value(key, str(default)), default)
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        return self.parse_bool(self.get_value(key, str(default).lower()))
+
+    @staticmethod
+    def parse_int(value: Optional[Union[str, int]], default: int = 0) -> int:
+        """Convert a stored value to int, falling back to default."""
+        if type(value) is int:
+            return value
         try:
             return int(value)
         except (TypeError, ValueError):
             return default
 
-    def get_bool(self, key: str, default: bool = False) -> bool:
-        value = self.get_value(key, str(default).lower())
-        return value.strip().lower() in ("1", "true", "yes", "on")
+    @staticmethod
+    def parse_bool(value: Optional[Union[str, int]], default: bool = False) -> bool:
+        """Convert a stored value to bool, falling back to default when missing."""
+        if value is None:
+            return default
+        if type(value) is int:
+            return value != 0
+        return value.strip().lower() in _TRUTHY_VALUES
+
+
+_shared_repositories: "weakref.WeakKeyDictionary[Database, SettingsRepository]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_settings_repository(
+    database: Optional[Database] = None,
+) -> SettingsRepository:
+    """
+    Get the SettingsRepository shared by every component using ``database``.
+
+    Defaults to the repository for ``get_shared_database()``. Settings
+    subsystems built on the same Database reuse one repository, and with it
+    the connection's cached compiled statements, instead of each wrapping
+    the Database separately.
+    """
+    db = database or get_shared_database()
+    repo = _shared_repositories.get(db)
+    if repo is None:
+        repo = _shared_repositories[db] = SettingsRepository(db)
+    return repo
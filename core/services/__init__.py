@@ -1,6 +1,7 @@
 """Services package for core utilities like PDF conversion."""
 
 from .artifact_export_service import ArtifactExportService
+from .artifact_export_queue import AsyncExportQueue
 from .chroma_service import ChromaService
 from .docling_service import DoclingService, PdfConversionResult
 from .rag_service import RagService, RagIndexRequest, RagIndexResult
@@ -19,6 +20,7 @@ from .model_capabilities_service import ModelCapabilitiesService
 
 __all__ = [
     "ArtifactExportService",
+    "AsyncExportQueue",
     "ChromaService",
     "DoclingService",
     "PdfConversionResult",
@@ -0,0 +1,108 @@
+"""Background queue for artifact exports.
+
+Session switches used to export artifacts synchronously on the UI thread. This
+queue hands the filesystem work to a single pooled worker and coalesces bursts
+of requests so only the latest pending export per session is written.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from PySide6.QtCore import QMutex, QMutexLocker, QObject, QRunnable, QThreadPool, Signal
+
+from core.services.artifact_export_service import ArtifactExportService
+
+logger = logging.getLogger(__name__)
+
+
+class _ExportRunnable(QRunnable):
+    """Pool task that drains the owning queue until it is empty."""
+
+    def __init__(self, queue: "AsyncExportQueue"):
+        super().__init__()
+        self._queue = queue
+
+    def run(self) -> None:
+        try:
+            self._queue._drain()
+        finally:
+            # Explicitly close thread-local database connections
+            # This prevents connection leaks when pool threads expire
+            self._queue._close_thread_connection()
+
+
+class AsyncExportQueue(QObject):
+    """Coalescing, off-thread front end for ``ArtifactExportService``.
+
+    Pending exports are keyed by session_id: re-submitting a session that has
+    not been written yet only refreshes its title. A single worker drains the
+    queue, so exports are serialized and never race on export filenames. The
+    worker closes its connection to the export service's database once the
+    queue is drained.
+
+    Signals:
+        export_completed: Emitted after a session export (session_id, file count)
+    """
+
+    export_completed = Signal(str, int)
+
+    def __init__(
+        self,
+        export_service: ArtifactExportService,
+        parent: Optional[QObject] = None,
+    ):
+        super().__init__(parent)
+        self._export_service = export_service
+        self._db = export_service.database
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._mutex = QMutex()
+        self._pending: dict[str, str] = {}
+        self._draining = False
+
+    def submit(self, session_id: str, session_title: str) -> None:
+        """Queue an export, replacing any pending request for the same session."""
+        with QMutexLocker(self._mutex):
+            self._pending[session_id] = session_title
+            if self._draining:
+                return
+            self._draining = True
+        self._pool.start(_ExportRunnable(self))
+
+    def pending_count(self) -> int:
+        """Number of sessions waiting to be exported."""
+        with QMutexLocker(self._mutex):
+            return len(self._pending)
+
+    def stop(self) -> None:
+        """Block until every queued export has been written (e.g., on app close)."""
+        self._pool.waitForDone()
+        # Anything submitted while the worker was winding down is flushed here.
+        self._drain()
+
+    def _take_next(self) -> Optional[tuple[str, str]]:
+        with QMutexLocker(self._mutex):
+            if not self._pending:
+                self._draining = False
+                return None
+            session_id = next(iter(self._pending))
+            return session_id, self._pending.pop(session_id)
+
+    def _drain(self) -> None:
+        while (item := self._take_next()) is not None:
+            self._export(*item)
+
+    def _close_thread_connection(self) -> None:
+        self._db.close()
+
+    def _export(self, session_id: str, session_title: str) -> None:
+        try:
+            exported = self._export_service.export_session(session_id, session_title)
+        except Exception as e:
+            logger.error("Failed to export session artifacts: %s", e)
+            return
+        if exported:
+            logger.info("Exported %d artifacts from session %s", len(exported), session_id)
+        self.export_completed.emit(session_id, len(exported))
@@ -18,6 +18,7 @@ from core.types import (
     ArtifactCodeV3,
 )
 from core.persistence.artifact_repository import ArtifactRepository
+from core.persistence.database import Database
 
 logger = logging.getLogger(__name__)
 
@@ -33,15 +34,24 @@ class ArtifactExportService:
     - Code artifacts: exported as fenced Markdown with language specified
     - PDF ingestions: use PDF base filename, append -2, -3 etc. for duplicates
     - Chat artifacts: use {session_title}-{tab_label}.md, overwrite on update
+    - Sessions whose artifacts are unchanged since their last full export are skipped
     """
 
     def __init__(self, artifact_repository: ArtifactRepository):
         self._artifact_repo = artifact_repository
         self._export_dir = EXPORT_DIR
+        # session_id -> artifacts.updated_at as of the last complete export
+        self._export_watermarks: dict[str, str] = {}
+
+    @property
+    def database(self) -> Database:
+        """Database backing the artifact repository."""
+        return self._artifact_repo.database
 
     def set_export_dir(self, path: Path) -> None:
         """Override the export directory."""
         self._export_dir = path
+        self._export_watermarks.clear()
 
     def export_session(
         self,
@@ -55,8 +65,15 @@ class ArtifactExportService:
             session_title: Title of the session (for naming chat artifacts).
 
         Returns:
-            List of paths to exported files.
+            List of paths to exported files (empty if nothing changed since
+            the last export).
         """
+        watermark = self._artifact_repo.get_updated_at(session_id)
+        if watermark is None:
+            return []
+        if self._export_watermarks.get(session_id) == watermark:
+            return []
+
         collection = self._artifact_repo.get_collection(session_id)
         if collection is None or not collection.artifacts:
             return []
@@ -65,6 +82,7 @@ class ArtifactExportService:
         self._export_dir.mkdir(parents=True, exist_ok=True)
 
         exported: list[Path] = []
+        failed = False
         text_count = 0
         code_count = 0
 
@@ -98,20 +116,43 @@ class ArtifactExportService:
             # Write file
             export_path = self._export_dir / filename
             try:
-                export_path.write_text(content_md, encoding="utf-8")
-                logger.info("Exported artifact to: %s", export_path)
+                # Match write_text's newline translation
+                data = content_md.replace("\n", os.linesep).encode("utf-8")
+                if self._write_if_changed(export_path, data):
+                    logger.info("Exported artifact to: %s", export_path)
                 exported.append(export_path)
 
                 # Update export metadata with the filename used
                 if entry.export_meta.export_filename != filename:
                     entry.export_meta.export_filename = filename
-                    self._artifact_repo.save_collection(session_id, collection)
+                    watermark = self._artifact_repo.save_collection(session_id, collection)
 
             except OSError as e:
                 logger.error("Failed to export artifact: %s", e)
+                failed = True
 
+        # Only remember fully successful exports so failed writes are retried
+        if failed:
+            self._export_watermarks.pop(session_id, None)
+        else:
+            self._export_watermarks[session_id] = watermark
         return exported
 
+    @staticmethod
+    def _write_if_changed(path: Path, data: bytes) -> bool:
+        """Write data to path unless the file already holds exactly these bytes.
+
+        Returns:
+            True if the file was written.
+        """
+        try:
+            if path.stat().st_size == len(data) and path.read_bytes() == data:
+                return False
+        except FileNotFoundError:
+            pass
+        path.write_bytes(data)
+        return True
+
     def _get_export_filename(
         self,
         entry: ArtifactEntry,
@@ -164,6 +164,27 @@ class ChromaService:
         except Exception as exc:
             logger.exception(f"Failed to delete document {document_id} from ChromaDB")
 
+    def delete_by_documents(self, document_ids: list[str]) -> bool:
+        """Delete all chunks for several documents in one call.
+
+        Args:
+            document_ids: Document IDs to delete
+
+        Returns:
+            True if the vectors were deleted (or there was nothing to delete).
+        """
+        if not document_ids:
+            return True
+        try:
+            self._collection.delete(
+                where={"document_id": {"$in": list(document_ids)}}
+            )
+            logger.info(f"Deleted ChromaDB vectors for {len(document_ids)} documents")
+        except Exception:
+            logger.exception("Failed to delete documents from ChromaDB")
+            return False
+        return True
+
     def delete_by_session(self, session_id: str) -> None:
         """Delete all chunks for a specific session (ChatPDF cleanup).
 
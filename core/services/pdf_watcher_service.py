@@ -37,6 +37,11 @@ class PdfWatcherService(QObject):
         self._known_mtimes: dict[str, float] = {}
         self._retry_counts: dict[str, int] = {}
 
+    @property
+    def folder_path(self) -> Optional[Path]:
+        """Folder currently being watched, or None when stopped."""
+        return self._folder_path
+
     def start(self, folder_path: str) -> None:
         folder = Path(folder_path).expanduser()
         if not folder.exists() or not folder.is_dir():
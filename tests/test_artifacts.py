@@ -1,6 +1,9 @@
 """Tests for artifact collection persistence and export."""
 
+import os
+import sqlite3
 import tempfile
+import threading
 from pathlib import Path
 from uuid import uuid4
 
@@ -8,6 +11,7 @@ import pytest
 
 from core.persistence.artifact_repository import ArtifactRepository
 from core.persistence.database import Database
+from core.services.artifact_export_queue import AsyncExportQueue
 from core.services.artifact_export_service import ArtifactExportService
 from core.types import (
     ArtifactCollectionV1,
@@ -253,3 +257,140 @@ class TestArtifactExportService:
             assert "test_doc.md" in filenames
             assert "test_doc-2.md" in filenames
 
+    def test_unchanged_session_export_is_skipped(self, artifact_repo, sample_text_artifact, test_session_id):
+        """Test that re-exporting an unchanged session writes nothing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            artifact_repo.save_for_session(test_session_id, sample_text_artifact)
+
+            export_service = ArtifactExportService(artifact_repo)
+            export_service.set_export_dir(Path(tmpdir))
+
+            exported = export_service.export_session(test_session_id, "Test")
+            assert len(exported) == 1
+            exported[0].unlink()
+
+            assert export_service.export_session(test_session_id, "Test") == []
+            assert not exported[0].exists()
+
+            # Any change to the collection re-enables the export
+            artifact_repo.save_for_session(test_session_id, sample_text_artifact)
+            assert export_service.export_session(test_session_id, "Test") == exported
+
+    def test_identical_export_files_are_not_rewritten(self, artifact_repo, sample_text_artifact, sample_code_artifact, test_session_id):
+        """Test that only artifacts whose Markdown changed are written."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            artifact_repo.save_for_session(test_session_id, sample_text_artifact)
+
+            export_service = ArtifactExportService(artifact_repo)
+            export_service.set_export_dir(Path(tmpdir))
+            (text_path,) = export_service.export_session(test_session_id, "Test")
+            os.utime(text_path, ns=(0, 0))
+
+            collection = artifact_repo.get_collection(test_session_id)
+            collection.artifacts.append(
+                ArtifactEntry(
+                    id=str(uuid4()),
+                    artifact=sample_code_artifact,
+                    export_meta=ArtifactExportMeta(),
+                )
+            )
+            artifact_repo.save_collection(test_session_id, collection)
+
+            exported = export_service.export_session(test_session_id, "Test")
+            assert len(exported) == 2
+            assert text_path.stat().st_mtime_ns == 0
+
+
+
+class _BlockingExportService:
+    """Export service stub that blocks its first call until released."""
+
+    def __init__(self, database: Database):
+        self.database = database
+        self.calls: list[tuple[str, str]] = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def export_session(self, session_id: str, session_title: str) -> list[Path]:
+        self.started.set()
+        self.release.wait(timeout=5)
+        self.calls.append((session_id, session_title))
+        return []
+
+
+class TestAsyncExportQueue:
+    """Tests for the background export queue."""
+
+    def test_writes_export_off_thread(self, artifact_repo, sample_text_artifact, test_session_id):
+        """Test that a submitted export is written once the queue is stopped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            entry = ArtifactEntry(
+                id=str(uuid4()),
+                artifact=sample_text_artifact,
+                export_meta=ArtifactExportMeta(),
+            )
+            collection = ArtifactCollectionV1(
+                version=1,
+                artifacts=[entry],
+                active_artifact_id=entry.id,
+            )
+            artifact_repo.save_collection(test_session_id, collection)
+
+            export_service = ArtifactExportService(artifact_repo)
+            export_service.set_export_dir(Path(tmpdir))
+            queue = AsyncExportQueue(export_service)
+
+            queue.submit(test_session_id, "Queued Session")
+            queue.stop()
+
+            assert (Path(tmpdir) / "Queued Session-Art_1.md").exists()
+            assert queue.pending_count() == 0
+
+    def test_worker_closes_its_connection_after_draining(self, temp_db):
+        """Test that the pool thread closes the connection it opened for exports."""
+        worker_connections = []
+        close = temp_db.close
+
+        def record_close():
+            connection = getattr(temp_db._local, "connection", None)
+            if threading.current_thread() is not threading.main_thread():
+                worker_connections.append(connection)
+            close()
+
+        temp_db.close = record_close
+        service = _BlockingExportService(temp_db)
+        service.release.set()
+        original_export = service.export_session
+
+        def export_with_query(session_id, session_title):
+            temp_db.get_connection().execute("SELECT 1")
+            return original_export(session_id, session_title)
+
+        service.export_session = export_with_query
+        queue = AsyncExportQueue(service)
+
+        queue.submit("session-a", "A")
+        queue.stop()
+
+        assert len(worker_connections) == 1
+        with pytest.raises(sqlite3.ProgrammingError):
+            worker_connections[0].execute("SELECT 1")
+
+    def test_coalesces_pending_exports_per_session(self, temp_db):
+        """Test that re-submitting a pending session keeps only the latest request."""
+        service = _BlockingExportService(temp_db)
+        queue = AsyncExportQueue(service)
+
+        queue.submit("session-a", "A")
+        assert service.started.wait(timeout=5)
+
+        # While "session-a" is being written, a burst for "session-b" queues up
+        queue.submit("session-b", "B1")
+        queue.submit("session-b", "B2")
+        queue.submit("session-b", "B3")
+        assert queue.pending_count() == 1
+
+        service.release.set()
+        queue.stop()
+
+        assert service.calls == [("session-a", "A"), ("session-b", "B3")]
@@ -118,6 +118,26 @@ class TestKeyringService:
         service.store_credential("openrouter", "key")
         assert service.has_any_credentials()
 
+    def test_credential_reads_are_cached_until_written(self, service, mock_keyring):
+        """Repeated reads hit the backend once; store/delete keep the cache current."""
+        service.store_credential("openrouter", "key1")
+        mock_keyring._storage.clear()
+        assert service.get_credential("openrouter") == "key1"
+
+        service.store_credential("exa", "key2")
+        assert service.get_credential("exa") == "key2"
+        service.delete_credential("exa")
+        assert service.get_credential("exa") is None
+
+    def test_credential_added_externally_after_miss(self, service, mock_keyring):
+        """A key stored outside the app after a lookup miss is still found."""
+        assert service.get_credential("exa") is None
+        assert not service.has_credential("exa")
+
+        mock_keyring._storage[(service.SERVICE_NAME, "exa_api_key")] = "external"
+        assert service.has_credential("exa")
+        assert service.get_credential("exa") == "external"
+
 
 class TestKeyringServiceMigration:
     """Tests for migrate_from_file functionality."""
@@ -238,3 +258,16 @@ class TestKeyringAvailability:
         svc._available = False
         
         assert not svc.delete_credential("openrouter")
+
+    def test_availability_is_probed_once_until_refreshed(self):
+        """Test that is_available caches the backend probe until refreshed."""
+        from core.infrastructure.keyring_service import KeyringService
+
+        svc = KeyringService()
+        with patch("keyring.get_keyring", return_value=MagicMock()) as get_keyring:
+            assert svc.is_available
+            assert svc.is_available
+            assert get_keyring.call_count == 1
+
+            assert svc.refresh_availability()
+            assert get_keyring.call_count == 2
@@ -128,3 +128,73 @@ def test_rag_repository_registry_upsert_replaces_hash(tmp_path) -> None:
     assert len(entries) == 1
     assert entries[0].content_hash == "hash2"
     assert entries[0].embedding_model == "model-b"
+
+
+def test_rag_repository_delete_documents_bulk(tmp_path) -> None:
+    db = Database(tmp_path / "test.db")
+    repository = RagRepository(db)
+    documents = [
+        repository.create_document(
+            workspace_id="GLOBAL",
+            source_type="pdf",
+            source_name=f"Doc{index}",
+            content_hash=f"hash{index}",
+        )
+        for index in range(3)
+    ]
+    for index, document in enumerate(documents):
+        chunk = RagChunkInput(
+            id=f"chunk-{index}",
+            chunk_index=0,
+            content=f"bulk delete content {index}",
+            section_title="Bulk",
+        )
+        repository.replace_document_chunks(document.id, [chunk], source_name=document.source_name)
+
+    repository.delete_documents([documents[0].id, documents[1].id])
+    repository.delete_documents([])
+
+    assert repository.get_document(documents[0].id) is None
+    assert repository.get_document(documents[1].id) is None
+    assert repository.get_document(documents[2].id) is not None
+    results = repository.search_lexical(
+        query="bulk",
+        scope="global",
+        workspace_id=None,
+        session_id=None,
+        limit=5,
+    )
+    assert [chunk_id for chunk_id, _score in results] == ["chunk-2"]
+
+
+def test_rag_repository_list_stale_document_refs(tmp_path) -> None:
+    from datetime import datetime, timedelta
+
+    db = Database(tmp_path / "test.db")
+    repository = RagRepository(db)
+    now = datetime.now()
+    stale = repository.create_document(
+        workspace_id="GLOBAL",
+        source_type="chatpdf",
+        source_name="Stale",
+        source_path="/tmp/stale.pdf",
+        content_hash="hash-stale",
+        stale_at=now - timedelta(days=10),
+    )
+    repository.create_document(
+        workspace_id="GLOBAL",
+        source_type="chatpdf",
+        source_name="Fresh",
+        content_hash="hash-fresh",
+        stale_at=now - timedelta(days=1),
+    )
+    repository.create_document(
+        workspace_id="GLOBAL",
+        source_type="pdf",
+        source_name="Global",
+        content_hash="hash-global",
+        stale_at=now - timedelta(days=10),
+    )
+
+    refs = repository.list_stale_document_refs(now - timedelta(days=7))
+    assert refs == [(stale.id, "/tmp/stale.pdf")]
@@ -2,7 +2,9 @@
 
 from pathlib import Path
 
-from core.persistence import Database
+import pytest
+
+from core.persistence import Database, get_shared_settings_repository
 from core.persistence.settings_repository import SettingsRepository
 
 
@@ -36,3 +38,126 @@ def test_settings_repository_collections(tmp_path: Path) -> None:
     all_settings = repo.get_all()
     keys = [setting.key for setting in all_settings]
     assert keys == ["alpha.one", "alpha.two", "beta.one"]
+
+
+def test_settings_repository_set_many(tmp_path: Path) -> None:
+    db = Database(tmp_path / "settings.db")
+    repo = SettingsRepository(db)
+
+    repo.set("alpha.one", "old", "alpha")
+    repo.set_many(
+        [
+            ("alpha.one", "1", "alpha"),
+            ("alpha.two", "2", "alpha"),
+            ("beta.one", "3", "beta"),
+        ]
+    )
+    repo.set_many([])
+
+    assert repo.get_value("alpha.one") == "1"
+    assert repo.get_value("alpha.two") == "2"
+    assert [setting.key for setting in repo.get_by_category("beta")] == ["beta.one"]
+
+
+def test_settings_repository_get_values(tmp_path: Path) -> None:
+    db = Database(tmp_path / "settings.db")
+    repo = SettingsRepository(db)
+
+    repo.set_many([("alpha.one", "1", "alpha"), ("alpha.two", "on", "alpha")])
+
+    values = repo.get_values(["alpha.one", "alpha.two", "missing"])
+    assert values == {"alpha.one": "1", "alpha.two": "on"}
+    assert repo.get_values([]) == {}
+    assert repo.parse_int(values.get("missing"), 5) == 5
+    assert repo.parse_bool(values.get("alpha.two")) is True
+    assert repo.parse_bool(values.get("missing"), True) is True
+
+
+def test_settings_repository_writes_join_transaction(tmp_path: Path) -> None:
+    db = Database(tmp_path / "settings.db")
+    repo = SettingsRepository(db)
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            repo.set("alpha.one", "1", "alpha")
+            repo.set_many([("alpha.two", "2", "alpha")])
+            raise RuntimeError("abort")
+
+    assert repo.get_values(["alpha.one", "alpha.two"]) == {}
+
+    with db.transaction():
+        repo.set("alpha.one", "1", "alpha")
+        repo.set_many([("alpha.two", "2", "alpha")])
+
+    other = SettingsRepository(Database(tmp_path / "settings.db"))
+    assert other.get_values(["alpha.one", "alpha.two"]) == {"alpha.one": "1", "alpha.two": "2"}
+
+
+def test_settings_repository_returns_native_ints_and_bools(tmp_path: Path) -> None:
+    db = Database(tmp_path / "settings.db")
+    repo = SettingsRepository(db)
+
+    repo.set("typed.int", 12, "test")
+    repo.set_many([("typed.bool", True, "test"), ("typed.text", "12", "test")])
+
+    assert repo.get_values(["typed.int", "typed.bool", "typed.text"]) == {
+        "typed.int": 12,
+        "typed.bool": 1,
+        "typed.text": "12",
+    }
+    # The TEXT column keeps the legacy form for get()/get_all() readers
+    assert repo.get_value("typed.bool") == "true"
+    assert repo.get_int("typed.int") == 12
+    assert repo.parse_bool(repo.get_values(["typed.bool"])["typed.bool"]) is True
+
+
+def test_settings_value_int_column_is_added_to_legacy_tables(tmp_path: Path) -> None:
+    import sqlite3
+
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE settings (key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+        "category TEXT NOT NULL, updated_at TEXT NOT NULL)"
+    )
+    conn.execute(
+        "INSERT INTO settings VALUES ('legacy.flag', 'true', 'test', '2024-01-01T00:00:00')"
+    )
+    conn.commit()
+    conn.close()
+
+    repo = SettingsRepository(Database(path))
+    values = repo.get_values(["legacy.flag"])
+    assert values == {"legacy.flag": "true"}
+    assert repo.parse_bool(values["legacy.flag"]) is True
+
+    repo.set("legacy.flag", False, "test")
+    assert repo.get_values(["legacy.flag"]) == {"legacy.flag": 0}
+
+
+def test_database_connection_pragmas(tmp_path: Path) -> None:
+    conn = Database(tmp_path / "settings.db").get_connection()
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+
+def test_shared_database_is_created_once(monkeypatch, tmp_path: Path) -> None:
+    from core.persistence import database as database_module
+
+    monkeypatch.setattr(database_module, "_shared_database", None)
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+    shared = database_module.get_shared_database()
+    assert database_module.get_shared_database() is shared
+    assert shared.db_path == tmp_path / ".attractor_desk" / "database.db"
+
+
+def test_shared_settings_repository_per_database(tmp_path: Path) -> None:
+    db = Database(tmp_path / "settings.db")
+
+    repo = get_shared_settings_repository(db)
+    assert get_shared_settings_repository(db) is repo
+    assert get_shared_settings_repository(Database(db.db_path)) is not repo
@@ -1,6 +1,9 @@
 """Tests for viewmodels."""
 
 from pathlib import Path
+from typing import Optional
+
+from PySide6.QtCore import QObject, Signal
 
 from core.models import ThemeMode
 from core.persistence import (
@@ -10,10 +13,46 @@ from core.persistence import (
     SessionRepository,
     WorkspaceRepository,
 )
-from ui.viewmodels import SettingsViewModel
+from ui.viewmodels import MainViewModel, SettingsViewModel
 from ui.viewmodels.workspace_viewmodel import WorkspaceViewModel
 
 
+class _StubChatViewModel(QObject):
+    """Minimal stand-in exposing the ChatViewModel surface MainViewModel uses."""
+
+    session_updated = Signal()
+    error_occurred = Signal(str)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.current_session_id: Optional[str] = None
+        self.loaded_sessions: list[str] = []
+
+    def load_session(self, session_id: str) -> None:
+        self.loaded_sessions.append(session_id)
+        self.current_session_id = session_id
+
+    def clear(self) -> None:
+        self.current_session_id = None
+
+
+def _build_main_viewmodel(db: Database) -> tuple[MainViewModel, WorkspaceViewModel, _StubChatViewModel]:
+    artifact_repo = ArtifactRepository(db)
+    workspace_vm = WorkspaceViewModel(
+        workspace_repository=WorkspaceRepository(db),
+        session_repository=SessionRepository(db),
+        message_repository=MessageRepository(db),
+        artifact_repository=artifact_repo,
+    )
+    chat_vm = _StubChatViewModel()
+    main_vm = MainViewModel(
+        chat_viewmodel=chat_vm,
+        workspace_viewmodel=workspace_vm,
+        artifact_repository=artifact_repo,
+    )
+    return main_vm, workspace_vm, chat_vm
+
+
 def test_workspace_viewmodel_crud(tmp_path: Path) -> None:
     db = Database(tmp_path / "workspace.db")
     workspace_repo = WorkspaceRepository(db)
@@ -41,6 +80,66 @@ def test_workspace_viewmodel_crud(tmp_path: Path) -> None:
     assert len(viewmodel.sessions) == 0
 
 
+def test_main_viewmodel_initialize_selects_first_session(tmp_path: Path) -> None:
+    db = Database(tmp_path / "bootstrap.db")
+    main_vm, workspace_vm, chat_vm = _build_main_viewmodel(db)
+    assert workspace_vm.bootstrap() == (0, None)
+    main_vm.initialize()
+    created = workspace_vm.current_session
+    assert created is not None
+    main_vm.shutdown()
+
+    main_vm, workspace_vm, chat_vm = _build_main_viewmodel(db)
+    count, first_session = workspace_vm.bootstrap()
+    assert count == 1
+    assert first_session is not None and first_session.id == created.id
+
+    main_vm.initialize()
+    assert workspace_vm.current_session is first_session
+    assert chat_vm.loaded_sessions == [created.id]
+    main_vm.shutdown()
+
+
+def test_main_viewmodel_builds_export_queue_on_first_export(tmp_path: Path) -> None:
+    db = Database(tmp_path / "lazy.db")
+    main_vm, workspace_vm, chat_vm = _build_main_viewmodel(db)
+    assert main_vm._export_queue is None
+
+    main_vm.export_current_session()
+    assert main_vm._export_queue is None
+
+    chat_vm.current_session_id = "session-1"
+    main_vm.export_current_session()
+    assert main_vm._export_queue is not None
+    main_vm.shutdown()
+
+
+def test_main_viewmodel_without_artifact_repository_skips_export(tmp_path: Path) -> None:
+    db = Database(tmp_path / "no_export.db")
+    _, workspace_vm, chat_vm = _build_main_viewmodel(db)
+    main_vm = MainViewModel(chat_viewmodel=chat_vm, workspace_viewmodel=workspace_vm)
+
+    chat_vm.current_session_id = "session-1"
+    main_vm.export_current_session()
+    main_vm.shutdown()
+    assert main_vm._export_queue is None
+
+
+def test_main_viewmodel_rewiring_does_not_duplicate_handlers(tmp_path: Path) -> None:
+    db = Database(tmp_path / "main.db")
+    main_vm, workspace_vm, chat_vm = _build_main_viewmodel(db)
+    main_vm.initialize()
+    session = workspace_vm.current_session
+    assert session is not None
+    chat_vm.loaded_sessions.clear()
+
+    main_vm._connect_signals()
+    workspace_vm.select_session(session.id)
+    main_vm.shutdown()
+
+    assert chat_vm.loaded_sessions == [session.id]
+
+
 def test_settings_viewmodel_persistence(tmp_path: Path) -> None:
     db = Database(tmp_path / "settings.db")
     settings_vm = SettingsViewModel(database=db)
@@ -136,6 +136,21 @@ def test_snapshot_and_restore(appearance_settings, qtbot):
     assert appearance_settings.transparency == 80
 
 
+def test_restore_unchanged_snapshot_emits_nothing(appearance_settings, qtbot):
+    """Test that restoring the current state is a silent no-op."""
+    appearance_settings.keep_above = True
+    qtbot.wait(10)
+    snapshot = appearance_settings.snapshot()
+
+    with (
+        qtbot.assertNotEmitted(appearance_settings.theme_changed),
+        qtbot.assertNotEmitted(appearance_settings.transparency_changed),
+        qtbot.assertNotEmitted(appearance_settings.keep_above_changed),
+        qtbot.assertNotEmitted(appearance_settings.settings_changed, wait=10),
+    ):
+        appearance_settings.restore_snapshot(snapshot)
+
+
 def test_no_signal_on_same_value(appearance_settings, qtbot):
     """Test that setting the same value doesn't emit signals."""
     appearance_settings.transparency = 100
@@ -150,3 +165,17 @@ def test_empty_font_family_ignored(appearance_settings):
     original = appearance_settings.font_family
     appearance_settings.font_family = ""
     assert appearance_settings.font_family == original
+
+
+def test_changes_reported_immediately(temp_db):
+    """Test that each change reaches the change sink and settings_changed at once."""
+    reported = []
+    settings = AppearanceSettings(database=temp_db, change_sink=lambda: reported.append("sink"))
+    settings.settings_changed.connect(lambda: reported.append("signal"))
+
+    settings.theme_mode = ThemeMode.LIGHT
+    settings.transparency = 70
+    assert reported == ["sink", "signal", "sink", "signal"]
+
+    settings.restore_snapshot(settings.snapshot())
+    assert len(reported) == 4
@@ -0,0 +1,225 @@
+"""Unit tests for ChatPDFCleanupService."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.persistence import Database, RagRepository
+from ui.viewmodels.settings.chatpdf_cleanup_service import (
+    MIN_CLEANUP_INTERVAL_MS,
+    ChatPDFCleanupService,
+)
+from ui.viewmodels.settings.rag_configuration_settings import RAGConfigurationSettings
+
+
+class _RecordingChromaService:
+    """ChromaService stand-in that records bulk deletes."""
+
+    def __init__(self):
+        self.deleted: list[list[str]] = []
+
+    def delete_by_documents(self, document_ids):
+        self.deleted.append(list(document_ids))
+        return True
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    """Create temporary database for testing."""
+    return Database(tmp_path / "test_cleanup.db")
+
+
+def _create_chatpdf_document(repository, tmp_path, name, stale_days):
+    pdf_path = tmp_path / f"{name}.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    document = repository.create_document(
+        workspace_id="GLOBAL",
+        source_type="chatpdf",
+        source_name=name,
+        source_path=str(pdf_path),
+        content_hash=f"hash-{name}",
+        stale_at=datetime.now() - timedelta(days=stale_days),
+    )
+    return document, pdf_path
+
+
+def test_cleanup_removes_only_expired_documents(temp_db, tmp_path):
+    """Test that expired documents are removed from disk, SQLite and Chroma."""
+    repository = RagRepository(temp_db)
+    rag_config = RAGConfigurationSettings(database=temp_db)
+    rag_config.rag_chatpdf_retention_days = 7
+    chroma = _RecordingChromaService()
+
+    old_a, old_a_path = _create_chatpdf_document(repository, tmp_path, "old-a", 30)
+    old_b, old_b_path = _create_chatpdf_document(repository, tmp_path, "old-b", 10)
+    fresh, fresh_path = _create_chatpdf_document(repository, tmp_path, "fresh", 1)
+
+    service = ChatPDFCleanupService(rag_config, temp_db, chroma)
+    try:
+        removed = service.cleanup_chatpdf_documents()
+    finally:
+        service.stop()
+
+    assert removed == 2
+    assert not old_a_path.exists()
+    assert not old_b_path.exists()
+    assert fresh_path.exists()
+    assert repository.get_document(old_a.id) is None
+    assert repository.get_document(old_b.id) is None
+    assert repository.get_document(fresh.id) is not None
+    assert chroma.deleted == [[old_a.id, old_b.id]]
+
+
+def test_cleanup_without_stale_documents_is_noop(temp_db):
+    """Test that cleanup reports zero removals when nothing is stale."""
+    rag_config = RAGConfigurationSettings(database=temp_db)
+    chroma = _RecordingChromaService()
+
+    service = ChatPDFCleanupService(rag_config, temp_db, chroma)
+    try:
+        assert service.cleanup_chatpdf_documents() == 0
+    finally:
+        service.stop()
+
+    assert chroma.deleted == []
+
+
+def test_timer_armed_for_next_retention_boundary(qtbot, temp_db, tmp_path):
+    """Test that the timer fires when the oldest stale document expires."""
+    repository = RagRepository(temp_db)
+    rag_config = RAGConfigurationSettings(database=temp_db)
+    rag_config.rag_chatpdf_retention_days = 7
+    _create_chatpdf_document(repository, tmp_path, "aging", 6)
+
+    service = ChatPDFCleanupService(rag_config, temp_db)
+    try:
+        one_day_ms = 24 * 60 * 60 * 1000
+        assert service._cleanup_timer.isSingleShot()
+        assert 0 < service._cleanup_timer.interval() <= one_day_ms
+
+        # Already overdue: wait the minimum interval instead of firing at once
+        rag_config.rag_chatpdf_retention_days = 6
+        assert service._cleanup_timer.interval() == MIN_CLEANUP_INTERVAL_MS
+    finally:
+        service.stop()
+
+    assert not service._cleanup_timer.isActive()
+
+
+def test_timer_backs_off_while_overdue_documents_cannot_be_removed(qtbot, temp_db, tmp_path):
+    """Test that runs removing nothing double the wait instead of spinning."""
+    repository = RagRepository(temp_db)
+    rag_config = RAGConfigurationSettings(database=temp_db)
+    rag_config.rag_chatpdf_retention_days = 7
+    _create_chatpdf_document(repository, tmp_path, "stuck", 30)
+    temp_db.get_connection().execute(
+        "CREATE TRIGGER keep_documents BEFORE DELETE ON rag_documents "
+        "BEGIN SELECT RAISE(ABORT, 'locked'); END"
+    )
+
+    service = ChatPDFCleanupService(rag_config, temp_db)
+    try:
+        assert service._cleanup_timer.interval() == MIN_CLEANUP_INTERVAL_MS
+        service._cleanup_timer.timeout.emit()
+        assert service._cleanup_timer.interval() == 2 * MIN_CLEANUP_INTERVAL_MS
+        service._cleanup_timer.timeout.emit()
+        assert service._cleanup_timer.interval() == 4 * MIN_CLEANUP_INTERVAL_MS
+    finally:
+        service.stop()
+
+
+def test_timer_waits_full_retention_when_nothing_is_stale(qtbot, temp_db):
+    """Test that an empty store waits one retention period."""
+    rag_config = RAGConfigurationSettings(database=temp_db)
+    rag_config.rag_chatpdf_retention_days = 2
+
+    service = ChatPDFCleanupService(rag_config, temp_db)
+    try:
+        interval = service._cleanup_timer.interval()
+        assert 24 * 60 * 60 * 1000 < interval <= 2 * 24 * 60 * 60 * 1000
+    finally:
+        service.stop()
+
+
+def test_cleanup_reports_failures_once(temp_db, tmp_path, caplog):
+    """Test that per-item failures are aggregated into a single warning."""
+    repository = RagRepository(temp_db)
+    rag_config = RAGConfigurationSettings(database=temp_db)
+    rag_config.rag_chatpdf_retention_days = 7
+
+    undeletable = tmp_path / "not-a-file"
+    undeletable.mkdir()
+    stuck = repository.create_document(
+        workspace_id="GLOBAL",
+        source_type="chatpdf",
+        source_name="stuck",
+        source_path=str(undeletable),
+        content_hash="hash-stuck",
+        stale_at=datetime.now() - timedelta(days=30),
+    )
+    _create_chatpdf_document(repository, tmp_path, "old", 30)
+
+    service = ChatPDFCleanupService(rag_config, temp_db)
+    try:
+        with caplog.at_level("WARNING"):
+            removed = service.cleanup_chatpdf_documents()
+    finally:
+        service.stop()
+
+    assert removed == 2
+    assert repository.get_document(stuck.id) is None
+    warnings = [record for record in caplog.records if record.levelname == "WARNING"]
+    assert [record.getMessage() for record in warnings] == [
+        "ChatPDF cleanup: 1 file, 0 database, 0 ChromaDB failures"
+    ]
+
+
+def test_cleanup_counts_chroma_failures(temp_db, tmp_path, caplog):
+    """Test that a failed ChromaDB delete is counted in the failure summary."""
+    repository = RagRepository(temp_db)
+    rag_config = RAGConfigurationSettings(database=temp_db)
+    rag_config.rag_chatpdf_retention_days = 7
+    _create_chatpdf_document(repository, tmp_path, "old-a", 30)
+    _create_chatpdf_document(repository, tmp_path, "old-b", 30)
+
+    class _FailingChromaService(_RecordingChromaService):
+        def delete_by_documents(self, document_ids):
+            super().delete_by_documents(document_ids)
+            return False
+
+    service = ChatPDFCleanupService(rag_config, temp_db, _FailingChromaService())
+    try:
+        with caplog.at_level("WARNING"):
+            assert service.cleanup_chatpdf_documents() == 2
+    finally:
+        service.stop()
+
+    warnings = [record for record in caplog.records if record.levelname == "WARNING"]
+    assert [record.getMessage() for record in warnings] == [
+        "ChatPDF cleanup: 0 file, 0 database, 2 ChromaDB failures"
+    ]
+
+
+def test_cleanup_is_not_reentrant(temp_db, tmp_path):
+    """Test that a cleanup triggered mid-cleanup is skipped."""
+    repository = RagRepository(temp_db)
+    rag_config = RAGConfigurationSettings(database=temp_db)
+    rag_config.rag_chatpdf_retention_days = 7
+    _create_chatpdf_document(repository, tmp_path, "old", 30)
+
+    nested_results = []
+
+    class _ReentrantChromaService(_RecordingChromaService):
+        def delete_by_documents(self, document_ids):
+            nested_results.append(service._run_cleanup())
+            return super().delete_by_documents(document_ids)
+
+    chroma = _ReentrantChromaService()
+    service = ChatPDFCleanupService(rag_config, temp_db, chroma)
+    try:
+        assert service.cleanup_chatpdf_documents() == 1
+    finally:
+        service.stop()
+
+    assert nested_results == [0]
+    assert len(chroma.deleted) == 1
@@ -1,21 +1,24 @@
 """Integration tests for SettingsCoordinator persistence."""
 
 import pytest
-from pathlib import Path
+
 from core.models import ThemeMode
 from core.persistence import Database
 from ui.viewmodels.settings import SettingsCoordinator
 
+
 @pytest.fixture
 def db_path(tmp_path):
     """Provide a path for the test database."""
     return tmp_path / "settings_test.db"
 
+
 @pytest.fixture
 def db(db_path):
     """Provide a Database instance."""
     return Database(db_path)
 
+
 def test_settings_persistence_cycle(db_path):
     """Test that settings persist correctly through save/load cycles."""
     # 1. Setup initial state
@@ -25,7 +28,7 @@ def test_settings_persistence_cycle(db_path):
 
     original_theme = coordinator1.theme_mode
     original_rag = coordinator1.rag_enabled
-    
+
     # 2. Change settings
     new_theme = ThemeMode.LIGHT if original_theme == ThemeMode.DARK else ThemeMode.DARK
     coordinator1.theme_mode = new_theme
@@ -52,13 +55,14 @@ def test_settings_persistence_cycle(db_path):
     assert coordinator2.rag_chunk_size_chars == 1500
     assert coordinator2.sidebar_visible is False
 
+
 def test_revert_to_saved(db_path):
     """Test reverting settings to their saved state."""
     # Setup and save initial state
     db = Database(db_path)
     coordinator = SettingsCoordinator(database=db)
     coordinator.load_settings()
-    
+
     coordinator.theme_mode = ThemeMode.DARK
     coordinator.transparency = 100
     coordinator.save_settings()
@@ -66,7 +70,7 @@ def test_revert_to_saved(db_path):
     # Make unsaved changes
     coordinator.theme_mode = ThemeMode.LIGHT
     coordinator.transparency = 50
-    
+
     assert coordinator.theme_mode == ThemeMode.LIGHT
     assert coordinator.transparency == 50
 
@@ -77,6 +81,7 @@ def test_revert_to_saved(db_path):
     assert coordinator.theme_mode == ThemeMode.DARK
     assert coordinator.transparency == 100
 
+
 def test_subsystem_delegation(db):
     """Test that facade properties correctly delegate to subsystems."""
     coordinator = SettingsCoordinator(database=db)
@@ -85,7 +90,7 @@ def test_subsystem_delegation(db):
     # Test appearance delegation
     coordinator.appearance.transparency = 85
     assert coordinator.transparency == 85
-    
+
     coordinator.transparency = 90
     assert coordinator.appearance.transparency == 90
 
@@ -96,13 +101,14 @@ def test_subsystem_delegation(db):
     coordinator.default_model = "openai/gpt-4-turbo"
     assert coordinator.models.default_model == "openai/gpt-4-turbo"
 
+
 def test_shortcuts_persistence(db_path):
     """Test persistence of keyboard shortcuts."""
     # 1. Set shortcut
     db1 = Database(db_path)
     coord1 = SettingsCoordinator(database=db1)
     coord1.load_settings()
-    
+
     coord1.set_shortcut_sequence("send_message", "Ctrl+Enter")
     coord1.save_settings()
 
@@ -113,17 +119,349 @@ def test_shortcuts_persistence(db_path):
 
     assert coord2.get_shortcut_sequence("send_message") == "Ctrl+Enter"
 
+
 def test_backward_compatibility(db):
     """Test that the SettingsViewModel alias works for backward compatibility."""
     from ui.viewmodels import SettingsViewModel
-    
+
     settings = SettingsViewModel(database=db)
     settings.load_settings()
 
     assert type(settings).__name__ == 'SettingsCoordinator'
-    
+
     # Check property aliases
     assert hasattr(settings, 'theme_mode')
     assert hasattr(settings, 'transparency')
     assert hasattr(settings, 'default_model')
     assert hasattr(settings, 'rag_enabled')
+
+
+def test_subsystem_signals_exposed_directly(db, qtbot):
+    """Test that coordinator signals are the subsystems' own signals."""
+    coordinator = SettingsCoordinator(database=db)
+
+    with qtbot.waitSignal(coordinator.transparency_changed) as blocker:
+        coordinator.appearance.transparency = 70
+    assert blocker.args == [70]
+
+    with qtbot.waitSignal(coordinator.settings_changed):
+        coordinator.transparency = 60
+
+
+def test_read_only_delegates_reject_assignment(db):
+    """Test that read-only facade attributes cannot be assigned."""
+    coordinator = SettingsCoordinator(database=db)
+    coordinator.load_settings()
+
+    assert coordinator.models_list == coordinator.models.models
+    with pytest.raises(AttributeError):
+        coordinator.models_list = []
+    with pytest.raises(AttributeError):
+        coordinator.theme_changed = None
+
+
+def test_snapshot_reuses_unchanged_subsystems(db, qtbot):
+    """Test that snapshot() only rebuilds subsystems that changed."""
+    coordinator = SettingsCoordinator(database=db)
+    coordinator.load_settings()
+
+    first = coordinator.snapshot()
+    coordinator.font_family = "Arial"
+    coordinator.rag_k_lex = 12
+    second = coordinator.snapshot()
+
+    assert second is not first
+    assert second["shortcuts"] is first["shortcuts"]
+    assert second["appearance"]["font_family"] == "Arial"
+    assert second["rag_config"]["rag_k_lex"] == 12
+    assert first["appearance"]["font_family"] != "Arial"
+
+
+def test_load_settings_reloads_keyring_subsystems_on_calling_thread(db):
+    """Test that built keyring-backed subsystems reload on the owning thread."""
+    import threading
+
+    coordinator = SettingsCoordinator(database=db)
+    load_threads = {}
+    original_load = coordinator.models.load
+
+    def recording_load():
+        load_threads["models"] = threading.current_thread()
+        original_load()
+
+    coordinator.models.load = recording_load
+    coordinator.default_model = "openai/gpt-4-turbo"
+    coordinator.save_settings()
+    coordinator.default_model = "other/model"
+
+    coordinator.load_settings()
+
+    assert load_threads["models"] is threading.current_thread()
+    assert coordinator.default_model == "openai/gpt-4-turbo"
+
+
+def test_revert_emits_settings_changed_once(db, qtbot):
+    """Test that a multi-subsystem revert notifies listeners once."""
+    coordinator = SettingsCoordinator(database=db)
+    coordinator.load_settings()
+    coordinator.save_settings()
+
+    coordinator.transparency = 50
+    coordinator.sidebar_visible = False
+    coordinator.rag_k_vec = 20
+    qtbot.wait(10)
+
+    emissions = []
+    coordinator.settings_changed.connect(lambda: emissions.append(True))
+    coordinator.revert_to_saved()
+    qtbot.wait(10)
+
+    assert emissions == [True]
+    assert coordinator.transparency == 100
+    assert coordinator.sidebar_visible is True
+
+
+def test_subsystems_report_changes_through_change_sink(db, qtbot):
+    """Test that subsystems notify the coordinator without a signal connection."""
+    coordinator = SettingsCoordinator(database=db)
+    coordinator.load_settings()
+    coordinator.snapshot()
+
+    received = []
+    coordinator.settings_changed.connect(lambda: received.append("coordinator"))
+    coordinator.ui_visibility.settings_changed.connect(lambda: received.append("subsystem"))
+    coordinator.sidebar_visible = False
+
+    assert coordinator.snapshot()["ui_visibility"]["sidebar_visible"] is False
+    assert received == ["subsystem"]
+    qtbot.waitUntil(lambda: "coordinator" in received, timeout=1000)
+    assert received == ["subsystem", "coordinator"]
+
+
+def test_settings_changed_coalesces_bursts(db, qtbot):
+    """Test that a burst of edits across subsystems emits settings_changed once."""
+    coordinator = SettingsCoordinator(database=db)
+    coordinator.load_settings()
+
+    emissions = []
+    coordinator.settings_changed.connect(lambda: emissions.append(True))
+    coordinator.sidebar_visible = False
+    coordinator.rag_k_lex = 12
+    coordinator.rag_k_vec = 20
+    assert emissions == []
+
+    qtbot.wait(10)
+    assert emissions == [True]
+
+
+def test_phase2_subsystems_are_built_on_first_access(db_path):
+    """Test that model settings are constructed lazily and load on first use."""
+    writer = SettingsCoordinator(database=Database(db_path))
+    writer.load_settings()
+    writer.default_model = "openai/gpt-4-turbo"
+    writer.save_settings()
+
+    coordinator = SettingsCoordinator(database=Database(db_path))
+    coordinator.load_settings()
+    coordinator.save_settings()
+
+    assert "models" not in coordinator.snapshot()
+
+    assert coordinator.default_model == "openai/gpt-4-turbo"
+    coordinator.default_model = "other/model"
+    coordinator.revert_to_saved()
+    assert coordinator.default_model == "openai/gpt-4-turbo"
+
+
+def test_startup_reads_leave_model_settings_unbuilt(db):
+    """Test that the main window's startup reads do not build model settings."""
+    coordinator = SettingsCoordinator(database=db)
+    toggles = []
+    coordinator.deep_search_toggled.connect(toggles.append)
+
+    assert coordinator.deep_search_enabled is False
+    snapshot = coordinator.snapshot()
+    assert "deep_search" in snapshot
+    assert "models" not in snapshot
+
+
+def test_save_settings_writes_only_changed_subsystems(db):
+    """Test that save_settings skips subsystems matching the saved state."""
+    coordinator = SettingsCoordinator(database=db)
+    coordinator.load_settings()
+
+    saved = []
+    for name in ("appearance", "shortcuts", "ui_visibility", "rag_config"):
+        subsystem = getattr(coordinator, name)
+        subsystem.save = lambda name=name: saved.append(name)
+
+    coordinator.save_settings()
+    assert saved == []
+
+    coordinator.sidebar_visible = False
+    coordinator.save_settings()
+    assert saved == ["ui_visibility"]
+
+    with pytest.raises(TypeError):
+        coordinator.snapshot()["ui_visibility"]["sidebar_visible"] = True
+
+
+def test_revert_restores_subsystems_built_after_load(db):
+    """Test that a subsystem first used after load reverts to its loaded state."""
+    coordinator = SettingsCoordinator(database=db)
+    coordinator.load_settings()
+    original_model = coordinator.default_model
+
+    coordinator.transparency = 60
+    coordinator.default_model = "other/model"
+    coordinator.revert_to_saved()
+
+    assert coordinator.transparency == 100
+    assert coordinator.default_model == original_model
+    assert coordinator.snapshot()["appearance"]["transparency"] == 100
+
+
+def test_keyring_not_probed_until_credentials_are_needed(db):
+    """Test that building the coordinator and model settings leaves the keyring untouched."""
+    from unittest.mock import PropertyMock, patch
+
+    from core.infrastructure.keyring_service import KeyringService
+
+    keyring = KeyringService()
+    with patch.object(
+        KeyringService, "is_available", new_callable=PropertyMock
+    ) as is_available:
+        coordinator = SettingsCoordinator(database=db, keyring_service=keyring)
+        coordinator.default_model
+        coordinator.deep_search_enabled
+
+    is_available.assert_not_called()
+
+
+def test_noop_assignments_do_not_notify(db):
+    """Test that re-assigning current values emits no change notifications."""
+    coordinator = SettingsCoordinator(database=db)
+    coordinator.load_settings()
+    coordinator.snapshot()
+
+    emissions = []
+    coordinator.settings_changed.connect(lambda: emissions.append(True))
+    coordinator.sidebar_visible = coordinator.sidebar_visible
+    coordinator.rag_k_lex = coordinator.rag_k_lex
+    coordinator.default_model = coordinator.default_model
+    coordinator.rag_global_folder = coordinator.rag_global_folder
+    coordinator.reset_shortcuts()
+
+    assert emissions == []
+
+
+def test_failed_save_rolls_back_every_subsystem(db_path):
+    """Test that save_settings commits all subsystem writes or none."""
+    coordinator = SettingsCoordinator(database=Database(db_path))
+    coordinator.load_settings()
+    coordinator.transparency = 60
+    coordinator.rag_k_lex = 12
+
+    def failing_save():
+        raise RuntimeError("disk full")
+
+    coordinator.rag_config.save = failing_save
+    errors = []
+    coordinator.error_occurred.connect(errors.append)
+    coordinator.save_settings()
+
+    assert errors == ["disk full"]
+    reloaded = SettingsCoordinator(database=Database(db_path))
+    reloaded.load_settings()
+    assert reloaded.transparency == 100
+
+
+def test_retry_after_failed_save_persists_rolled_back_changes(db_path):
+    """Test that subsystems rolled back by a failed save are written on retry."""
+    coordinator = SettingsCoordinator(database=Database(db_path))
+    coordinator.load_settings()
+    coordinator.transparency = 60
+    coordinator.rag_k_lex = 12
+
+    def failing_save():
+        raise RuntimeError("busy")
+
+    coordinator.rag_config.save = failing_save
+    coordinator.save_settings()
+    del coordinator.rag_config.save
+    coordinator.save_settings()
+
+    reloaded = SettingsCoordinator(database=Database(db_path))
+    reloaded.load_settings()
+    assert reloaded.transparency == 60
+    assert reloaded.rag_k_lex == 12
+
+
+def test_save_settings_retries_failed_keyring_writes(db):
+    """Test that a key the keyring rejected is not recorded as saved."""
+    from unittest.mock import MagicMock
+
+    keyring = MagicMock()
+    keyring.is_available = True
+    keyring.get_credential.return_value = None
+    keyring.store_credential.return_value = False
+    coordinator = SettingsCoordinator(database=db, keyring_service=keyring)
+    coordinator.load_settings()
+
+    coordinator.api_key = "or-key"
+    coordinator.save_settings()
+    keyring.store_credential.return_value = True
+    coordinator.save_settings()
+
+    assert [c.args for c in keyring.store_credential.call_args_list] == [
+        ("openrouter", "or-key"),
+        ("openrouter", "or-key"),
+    ]
+
+
+def test_revert_restores_only_changed_subsystems(db, qtbot):
+    """Test that revert_to_saved leaves subsystems matching the saved state alone."""
+    coordinator = SettingsCoordinator(database=db)
+    coordinator.load_settings()
+
+    emissions = []
+    coordinator.settings_changed.connect(lambda: emissions.append(True))
+    toggles = []
+    coordinator.deep_search_toggled.connect(toggles.append)
+
+    coordinator.revert_to_saved()
+    qtbot.wait(10)
+    assert emissions == []
+
+    coordinator.rag_k_vec = 20
+    emissions.clear()
+    restored = []
+    original_restore = coordinator.ui_visibility.restore_snapshot
+    coordinator.ui_visibility.restore_snapshot = lambda part: (
+        restored.append(part), original_restore(part)
+    )
+    coordinator.revert_to_saved()
+
+    assert emissions == [True]
+    assert restored == []
+    assert toggles == []
+    assert coordinator.rag_k_vec == 8
+
+
+def test_collection_properties_are_read_only_views(db):
+    """Test that list and mapping properties are immutable instead of copies."""
+    coordinator = SettingsCoordinator(database=db)
+
+    assert isinstance(coordinator.models_list, tuple)
+    assert isinstance(coordinator.image_models_list, tuple)
+    assert coordinator.shortcut_definitions is coordinator.shortcut_definitions
+
+    bindings = coordinator.shortcut_bindings
+    with pytest.raises(TypeError):
+        bindings["new_session"] = "Ctrl+Q"
+    previous = bindings["new_session"]
+    coordinator.shortcuts.set_shortcut_sequence("new_session", "Ctrl+Alt+Q")
+    assert bindings["new_session"] == previous
+    assert coordinator.shortcut_bindings["new_session"] == "Ctrl+Alt+Q"
+    coordinator.add_model("custom/model")
+    assert "custom/model" in coordinator.models_list
@@ -0,0 +1,114 @@
+"""Unit tests for DeepSearchSettings."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.persistence import Database
+from ui.viewmodels.settings.deep_search_settings import DeepSearchSettings
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    """Create temporary database for testing."""
+    return Database(tmp_path / "test_deep_search.db")
+
+
+@pytest.fixture
+def keyring():
+    """Keyring service stand-in holding an Exa key."""
+    keyring = MagicMock()
+    keyring.is_available = True
+    keyring.get_credential.side_effect = {"exa": "exa-key"}.get
+    keyring.store_credential.return_value = True
+    return keyring
+
+
+def test_fields_normalize_and_notify_on_change(temp_db):
+    """Deep search setters normalize input and only notify on real changes."""
+    settings = DeepSearchSettings(temp_db)
+    toggles = []
+    changes = []
+    settings.deep_search_toggled.connect(toggles.append)
+    settings.settings_changed.connect(lambda: changes.append(True))
+
+    settings.deep_search_enabled = 1
+    settings.deep_search_enabled = True
+    settings.search_provider = "bing"
+    settings.exa_api_key = None
+    settings.deep_search_num_results = 50
+
+    assert settings.deep_search_enabled is True
+    assert settings.search_provider == "exa"
+    assert settings.exa_api_key == ""
+    assert settings.deep_search_num_results == 20
+    assert toggles == [True]
+    assert changes == [True, True]
+
+
+def test_restore_emits_only_on_change(temp_db):
+    """Test that restoring the current state stays silent."""
+    settings = DeepSearchSettings(temp_db)
+    toggles = []
+    changes = []
+    settings.deep_search_toggled.connect(toggles.append)
+    settings.settings_changed.connect(lambda: changes.append(True))
+
+    settings.restore_snapshot(settings.snapshot())
+    assert toggles == [] and changes == []
+
+    snapshot = dict(settings.snapshot(), deep_search_num_results=9)
+    settings.restore_snapshot(snapshot)
+    assert toggles == [] and changes == [True]
+
+    settings.restore_snapshot(dict(snapshot, deep_search_enabled=True))
+    assert toggles == [True] and changes == [True, True]
+
+
+def test_load_reads_settings_with_one_query(temp_db):
+    """Test that loading fetches every deep search setting in a single query."""
+    writer = DeepSearchSettings(temp_db)
+    writer.deep_search_num_results = 9
+    writer.search_provider = "firecrawl"
+    writer.save()
+
+    settings = DeepSearchSettings(temp_db)
+    statements = []
+    temp_db.get_connection().set_trace_callback(statements.append)
+    settings.load()
+    temp_db.get_connection().set_trace_callback(None)
+
+    assert len([s for s in statements if "FROM settings" in s]) == 1
+    assert settings.deep_search_num_results == 9
+    assert settings.search_provider == "firecrawl"
+
+
+def test_save_skips_keyring_writes_for_unchanged_keys(temp_db, keyring):
+    """Test that API keys are only written to the keyring when they change."""
+    settings = DeepSearchSettings(temp_db, keyring)
+    settings.load()
+    settings.mark_unsaved()
+    settings.save()
+    keyring.store_credential.assert_not_called()
+
+    settings.firecrawl_api_key = "fc-key"
+    settings.save()
+    settings.mark_unsaved()
+    settings.save()
+    keyring.store_credential.assert_called_once_with("firecrawl", "fc-key")
+
+
+def test_failed_keyring_write_stays_pending(temp_db, keyring):
+    """Test that API keys the keyring rejected are retried on the next save."""
+    keyring.store_credential.return_value = False
+    settings = DeepSearchSettings(temp_db, keyring)
+    settings.load()
+
+    settings.firecrawl_api_key = "fc-key"
+    settings.save()
+    assert settings.has_unsaved_changes
+
+    keyring.store_credential.return_value = True
+    settings.save()
+    assert not settings.has_unsaved_changes
+    assert keyring.store_credential.call_count == 2
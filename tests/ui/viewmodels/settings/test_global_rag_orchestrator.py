@@ -0,0 +1,179 @@
+"""Unit tests for GlobalRAGOrchestrator."""
+
+from pathlib import Path
+
+import pytest
+from PySide6.QtCore import QObject, Signal
+
+from core.persistence import Database
+from ui.viewmodels.settings import global_rag_orchestrator
+from ui.viewmodels.settings.global_rag_orchestrator import GlobalRAGOrchestrator
+from ui.viewmodels.settings.model_settings import ModelSettings
+from ui.viewmodels.settings.rag_configuration_settings import RAGConfigurationSettings
+
+
+class _FakeGlobalRagService(QObject):
+    """GlobalRagService stand-in that records the requests it receives."""
+
+    index_progress = Signal(int, int, str)
+    index_complete = Signal(object)
+    index_error = Signal(str)
+
+    def __init__(self, repository, chroma_service, parent=None):
+        super().__init__(parent)
+        self.busy = False
+        self.folder_requests = []
+        self.path_requests = []
+
+    def is_busy(self):
+        return self.busy
+
+    def index_folder(self, folder, request):
+        self.folder_requests.append((folder, request))
+
+    def index_paths(self, request):
+        self.path_requests.append(request)
+
+    def get_registry_status_counts(self):
+        return {}
+
+
+class _FakePdfWatcherService(QObject):
+    """PdfWatcherService stand-in that records start requests."""
+
+    new_pdfs_detected = Signal(list)
+    watcher_error = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.folder_path = None
+        self.starts = []
+
+    def start(self, folder):
+        self.starts.append(folder)
+        self.folder_path = Path(folder).expanduser()
+
+    def stop(self):
+        self.folder_path = None
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    """Create temporary database for testing."""
+    return Database(tmp_path / "test_global_rag.db")
+
+
+@pytest.fixture
+def rag_services(monkeypatch):
+    """Replace the orchestrator's services with fakes and collect the instances."""
+    created = {"service": [], "watcher": []}
+
+    def build(kind, cls):
+        def factory(*args):
+            instance = cls(*args)
+            created[kind].append(instance)
+            return instance
+        return factory
+
+    monkeypatch.setattr(
+        global_rag_orchestrator, "GlobalRagService", build("service", _FakeGlobalRagService)
+    )
+    monkeypatch.setattr(
+        global_rag_orchestrator, "PdfWatcherService", build("watcher", _FakePdfWatcherService)
+    )
+    return created
+
+
+@pytest.fixture
+def rag_config(temp_db):
+    """Create RAGConfigurationSettings instance for testing."""
+    return RAGConfigurationSettings(temp_db)
+
+
+@pytest.fixture
+def orchestrator(temp_db, rag_config):
+    """Create GlobalRAGOrchestrator instance for testing."""
+    return GlobalRAGOrchestrator(rag_config, ModelSettings(temp_db), temp_db)
+
+
+def test_progress_relays_service_progress(orchestrator, rag_services):
+    """Test that indexing progress reaches orchestrator listeners unchanged."""
+    received = []
+    orchestrator.global_rag_progress.connect(lambda *args: received.append(args))
+    orchestrator.get_global_registry_status_counts()
+
+    rag_services["service"][0].index_progress.emit(1, 3, "doc.pdf")
+
+    assert received == [(1, 3, "doc.pdf")]
+
+
+def test_services_built_on_first_use(orchestrator, rag_config, tmp_path, rag_services):
+    """Test that the orchestrator defers its indexing service and folder watcher."""
+    orchestrator.update_monitoring_state()
+    assert rag_services == {"service": [], "watcher": []}
+
+    rag_config.rag_global_folder = str(tmp_path)
+    rag_config.rag_global_monitoring_enabled = True
+    orchestrator.update_monitoring_state()
+    assert [w.folder_path for w in rag_services["watcher"]] == [tmp_path]
+    assert rag_services["service"] == []
+
+    assert orchestrator.get_global_registry_status_counts() == {}
+    assert len(rag_services["service"]) == 1
+
+
+def test_watcher_not_restarted_for_same_folder(orchestrator, rag_config, tmp_path, rag_services):
+    """Test that refreshing monitoring for the watched folder keeps the watcher running."""
+    rag_config.rag_global_folder = str(tmp_path)
+    rag_config.rag_global_monitoring_enabled = True
+    orchestrator.update_monitoring_state()
+    orchestrator.update_monitoring_state()
+
+    [watcher] = rag_services["watcher"]
+    assert watcher.starts == [str(tmp_path)]
+    assert watcher.folder_path == tmp_path
+
+    rag_config.rag_global_monitoring_enabled = False
+    orchestrator.update_monitoring_state()
+    assert watcher.folder_path is None
+
+
+def test_index_request_reused_until_inputs_change(orchestrator, rag_config, tmp_path, rag_services):
+    """Test that the orchestrator reuses its index request while settings are unchanged."""
+    rag_config.rag_global_folder = str(tmp_path)
+
+    orchestrator.start_global_index()
+    orchestrator.scan_global_folder()
+    orchestrator.start_global_index(force_reindex=True)
+    rag_config.rag_chunk_size_chars += 100
+    orchestrator.start_global_index()
+
+    [service] = rag_services["service"]
+    first, second, forced, rebuilt = (request for _, request in service.folder_requests)
+    assert second is first
+    assert forced.force_reindex is True
+    assert rebuilt is not first
+    assert rebuilt.chunk_size_chars == first.chunk_size_chars + 100
+
+
+def test_watcher_detections_are_indexed_in_one_batch(
+    orchestrator, rag_config, tmp_path, qtbot, rag_services
+):
+    """Test that bursts of watcher detections coalesce into one index_paths call."""
+    rag_config.rag_global_folder = str(tmp_path)
+    rag_config.rag_global_monitoring_enabled = True
+    orchestrator.update_monitoring_state()
+    orchestrator.get_global_registry_status_counts()
+    [watcher] = rag_services["watcher"]
+    [service] = rag_services["service"]
+    service.busy = True
+
+    watcher.new_pdfs_detected.emit(["/docs/b.pdf"])
+    watcher.new_pdfs_detected.emit(["/docs/a.pdf", "/docs/b.pdf"])
+    qtbot.wait(orchestrator.INDEX_DEBOUNCE_MS * 2)
+    # Busy service: detections stay queued instead of being rejected
+    assert service.path_requests == []
+
+    service.busy = False
+    qtbot.waitUntil(lambda: len(service.path_requests) == 1)
+    assert service.path_requests[0].pdf_paths == ["/docs/a.pdf", "/docs/b.pdf"]
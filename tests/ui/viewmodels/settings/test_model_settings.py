@@ -0,0 +1,114 @@
+"""Unit tests for ModelSettings."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.persistence import Database, SettingsRepository
+from ui.viewmodels.settings.model_settings import ModelSettings
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    """Create temporary database for testing."""
+    return Database(tmp_path / "test_model_settings.db")
+
+
+@pytest.fixture
+def keyring():
+    """Keyring service stand-in holding an OpenRouter key."""
+    keyring = MagicMock()
+    keyring.is_available = True
+    keyring.get_credential.side_effect = {"openrouter": "or-key"}.get
+    keyring.store_credential.return_value = True
+    return keyring
+
+
+def _stored_keys(database):
+    """Return the setting keys persisted in the database."""
+    return {setting.key for setting in SettingsRepository(database).get_all()}
+
+
+def test_save_writes_only_changed_keys(temp_db):
+    """Test that ModelSettings persists only the keys changed since load."""
+    settings = ModelSettings(temp_db)
+    settings.load()
+
+    settings.default_model = "openai/gpt-4o"
+    settings.save()
+    assert _stored_keys(temp_db) == {ModelSettings.KEY_DEFAULT_MODEL}
+
+    settings.add_image_model("custom/vision")
+    settings.save()
+    assert _stored_keys(temp_db) == {
+        ModelSettings.KEY_DEFAULT_MODEL,
+        ModelSettings.KEY_IMAGE_MODEL_LIST,
+    }
+
+    settings.mark_unsaved()
+    settings.save()
+    assert ModelSettings.KEY_MODEL_LIST in _stored_keys(temp_db)
+
+
+def test_load_reads_settings_with_one_query(temp_db):
+    """Test that loading fetches every model setting in a single query."""
+    writer = ModelSettings(temp_db)
+    writer.default_model = "openai/gpt-4-turbo"
+    writer.save()
+
+    settings = ModelSettings(temp_db)
+    statements = []
+    temp_db.get_connection().set_trace_callback(statements.append)
+    settings.load()
+    temp_db.get_connection().set_trace_callback(None)
+
+    assert len([s for s in statements if "FROM settings" in s]) == 1
+    assert settings.default_model == "openai/gpt-4-turbo"
+
+
+def test_save_skips_keyring_write_for_unchanged_key(temp_db, keyring):
+    """Test that the API key is only written to the keyring when it changes."""
+    settings = ModelSettings(temp_db, keyring)
+    settings.load()
+    settings.mark_unsaved()
+    settings.save()
+    keyring.store_credential.assert_not_called()
+
+    settings.api_key = "or-key-2"
+    settings.save()
+    keyring.store_credential.assert_called_once_with("openrouter", "or-key-2")
+
+
+def test_add_model_membership_follows_restore(temp_db):
+    """Test that duplicate checks track the model lists through restore."""
+    settings = ModelSettings(temp_db)
+    settings.load()
+    snapshot = settings.snapshot()
+
+    settings.add_model("custom/one")
+    settings.add_model("custom/one")
+    assert settings.models.count("custom/one") == 1
+
+    settings.restore_snapshot(snapshot)
+    assert "custom/one" not in settings.models
+    settings.add_model("custom/one")
+    assert settings.models.count("custom/one") == 1
+    # Model tuples are immutable, so reads and snapshots share them
+    assert settings.snapshot()["models"] is settings.models
+    assert "custom/one" not in snapshot["models"]
+
+
+def test_failed_keyring_write_stays_pending(temp_db, keyring):
+    """Test that an API key the keyring rejected is retried on the next save."""
+    keyring.store_credential.return_value = False
+    settings = ModelSettings(temp_db, keyring)
+    settings.load()
+
+    settings.api_key = "or-key-2"
+    settings.save()
+    assert settings.has_unsaved_changes
+
+    keyring.store_credential.return_value = True
+    settings.save()
+    assert not settings.has_unsaved_changes
+    assert keyring.store_credential.call_count == 2
@@ -0,0 +1,79 @@
+"""Unit tests for RAGConfigurationSettings."""
+
+import pytest
+
+from core.constants import DEFAULT_EMBEDDING_MODEL
+from core.persistence import Database, SettingsRepository
+from ui.viewmodels.settings.rag_configuration_settings import RAGConfigurationSettings
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    """Create temporary database for testing."""
+    return Database(tmp_path / "test_rag_config.db")
+
+
+@pytest.fixture
+def rag_config(temp_db):
+    """Create RAGConfigurationSettings instance for testing."""
+    return RAGConfigurationSettings(temp_db)
+
+
+def test_fields_normalize_and_round_trip(rag_config, temp_db):
+    """Test that table-driven RAG fields clamp, notify once, and persist."""
+    changes = []
+    rag_config.settings_changed.connect(lambda: changes.append(True))
+
+    rag_config.rag_k_lex = 500
+    rag_config.rag_k_lex = 50
+    rag_config.rag_scope = "bogus"
+    rag_config.rag_embedding_model = "  custom/embed  "
+    assert rag_config.rag_k_lex == 50
+    assert rag_config.rag_scope == "global"
+    assert rag_config.rag_embedding_model == "custom/embed"
+    assert len(changes) == 2
+
+    rag_config.rag_enabled = True
+    rag_config.save()
+
+    reloaded = RAGConfigurationSettings(temp_db)
+    reloaded.load()
+    assert reloaded.snapshot() == rag_config.snapshot()
+
+
+def test_exposes_effective_index_settings(rag_config):
+    """Test the derived embedding settings used to build index requests."""
+    rag_config.rag_embedding_model = ""
+    assert rag_config.effective_embedding_model == DEFAULT_EMBEDDING_MODEL
+    rag_config.rag_embedding_model = "custom/model"
+    assert rag_config.effective_embedding_model == "custom/model"
+
+    rag_config.rag_enabled = True
+    rag_config.rag_k_vec = 0
+    assert rag_config.embeddings_enabled is False
+    rag_config.rag_k_vec = 4
+    assert rag_config.embeddings_enabled is True
+
+
+def test_save_commits_once(rag_config, temp_db):
+    """Test that a standalone save writes every key in one commit."""
+    rag_config.load()
+    rag_config.rag_k_lex = 3
+
+    statements = []
+    temp_db.get_connection().set_trace_callback(statements.append)
+    rag_config.save()
+    temp_db.get_connection().set_trace_callback(None)
+
+    assert [s for s in statements if s.strip().upper() == "COMMIT"] == ["COMMIT"]
+
+
+def test_load_clamps_stored_retention_days(rag_config, temp_db):
+    """Test that an out-of-range stored retention is clamped like the setter."""
+    SettingsRepository(temp_db).set_many(
+        [(RAGConfigurationSettings.KEY_RAG_CHATPDF_RETENTION_DAYS, 0, "rag")]
+    )
+
+    rag_config.load()
+
+    assert rag_config.rag_chatpdf_retention_days == 1
@@ -0,0 +1,12 @@
+"""Tests for the settings package namespace."""
+
+import pytest
+
+import ui.viewmodels.settings as settings_package
+
+
+@pytest.mark.parametrize("name", settings_package.__all__)
+def test_exported_names_resolve(name):
+    """Every name in __all__ is importable from the package."""
+    assert getattr(settings_package, name) is not None
+    assert name in dir(settings_package)
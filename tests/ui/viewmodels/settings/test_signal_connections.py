@@ -0,0 +1,32 @@
+"""Lint-style checks for signal wiring in the viewmodel layer."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+VIEWMODELS_DIR = Path(__file__).resolve().parents[4] / "ui" / "viewmodels"
+
+# String-based connects go through signature normalization; lambdas hide the
+# slot signature from Qt. Both should use bound methods or signals instead.
+FORBIDDEN_PATTERNS = {
+    "string-based SIGNAL()": re.compile(r"\bSIGNAL\("),
+    "string-based SLOT()": re.compile(r"\bSLOT\("),
+    "lambda slot": re.compile(r"\.connect\(\s*lambda\b"),
+}
+
+
+@pytest.mark.parametrize(
+    "source_path",
+    sorted(VIEWMODELS_DIR.rglob("*.py")),
+    ids=lambda path: str(path.relative_to(VIEWMODELS_DIR)),
+)
+def test_viewmodel_connects_use_callables(source_path):
+    """Viewmodels connect signals to bound methods or signals only."""
+    source = source_path.read_text(encoding="utf-8")
+    violations = [
+        f"{label} at line {source.count(chr(10), 0, match.start()) + 1}"
+        for label, pattern in FORBIDDEN_PATTERNS.items()
+        for match in pattern.finditer(source)
+    ]
+    assert not violations, f"{source_path.name}: {', '.join(violations)}"
@@ -0,0 +1,33 @@
+"""Unit tests for UIVisibilitySettings."""
+
+import pytest
+
+from core.persistence import Database
+from ui.viewmodels.settings.ui_visibility_settings import UIVisibilitySettings
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    """Create temporary database for testing."""
+    return Database(tmp_path / "test_ui_visibility.db")
+
+
+def _inserts(statements):
+    return [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+
+
+def test_save_skips_clean_state(temp_db):
+    """Test that saving with no changes since load issues no writes."""
+    settings = UIVisibilitySettings(temp_db)
+    settings.load()
+
+    statements = []
+    temp_db.get_connection().set_trace_callback(statements.append)
+    settings.save()
+    assert _inserts(statements) == []
+
+    settings.sidebar_visible = False
+    settings.save()
+    settings.save()
+    temp_db.get_connection().set_trace_callback(None)
+    assert len(_inserts(statements)) == 2
@@ -18,12 +18,12 @@ from PySide6.QtWidgets import (
 from core.models import ThemeMode
 from core.persistence import (
     ArtifactRepository,
-    Database,
     MessageAttachmentRepository,
     MessageRepository,
     RagRepository,
     SessionRepository,
     WorkspaceRepository,
+    get_shared_database,
 )
 from core.services import ModelCapabilitiesService, RagService, LocalRagService, ChromaService
 from ui.styles import get_dark_theme_stylesheet, get_light_theme_stylesheet
@@ -45,7 +45,7 @@ class MainWindow(QMainWindow):
 
     def __init__(self):
         super().__init__()
-        self._database = Database()
+        self._database = get_shared_database()
         self._chroma_service = ChromaService()
         self._settings_viewmodel = SettingsViewModel(
             database=self._database,
@@ -341,5 +341,5 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event) -> None:
         """Export artifacts on app close."""
-        self._main_viewmodel.export_current_session()
+        self._main_viewmodel.shutdown()
         super().closeEvent(event)
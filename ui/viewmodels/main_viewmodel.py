@@ -5,15 +5,20 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import QObject, Qt, Signal, Slot
 
 from core.persistence import ArtifactRepository
+from core.services.artifact_export_queue import AsyncExportQueue
 from core.services.artifact_export_service import ArtifactExportService
 from ui.viewmodels.chat_viewmodel import ChatViewModel
 from ui.viewmodels.workspace_viewmodel import WorkspaceViewModel
 
 logger = logging.getLogger(__name__)
 
+# All MainViewModel wiring is UI-thread to UI-thread, so slots are invoked
+# directly. ConnectionType is not a flag enum in PySide6, hence the value OR.
+_DIRECT_UNIQUE = Qt.ConnectionType(Qt.DirectConnection.value | Qt.UniqueConnection.value)
+
 
 class MainViewModel(QObject):
     """Main ViewModel coordinating the application state."""
@@ -24,25 +29,40 @@ class MainViewModel(QObject):
         self,
         chat_viewmodel: ChatViewModel,
         workspace_viewmodel: WorkspaceViewModel,
-        artifact_repository: ArtifactRepository,
+        artifact_repository: Optional[ArtifactRepository] = None,
         parent: Optional[QObject] = None,
     ):
         super().__init__(parent)
         self.chat_viewmodel = chat_viewmodel
         self.workspace_viewmodel = workspace_viewmodel
-        self._export_service = ArtifactExportService(artifact_repository)
+        self._artifact_repository = artifact_repository
+        # Export service and its worker pool are built on the first export
+        self._export_queue: Optional[AsyncExportQueue] = None
         self._connect_signals()
 
+    @property
+    def _exports(self) -> AsyncExportQueue:
+        """Background export queue, created on first use."""
+        if self._export_queue is None:
+            export_service = ArtifactExportService(self._artifact_repository)
+            self._export_queue = AsyncExportQueue(export_service, parent=self)
+        return self._export_queue
+
     def _connect_signals(self) -> None:
+        # UniqueConnection makes re-wiring a no-op instead of doubling every
+        # session switch (and its artifact export).
         self.workspace_viewmodel.current_session_changed.connect(
-            self._on_session_selected
+            self._on_session_selected, _DIRECT_UNIQUE
         )
         self.workspace_viewmodel.current_workspace_changed.connect(
-            self._on_workspace_selected
+            self._on_workspace_selected, _DIRECT_UNIQUE
         )
-        self.chat_viewmodel.session_updated.connect(self.workspace_viewmodel.refresh_sessions)
-        self.chat_viewmodel.error_occurred.connect(self.error_occurred.emit)
+        self.chat_viewmodel.session_updated.connect(
+            self.workspace_viewmodel.refresh_sessions, _DIRECT_UNIQUE
+        )
+        self.chat_viewmodel.error_occurred.connect(self.error_occurred, _DIRECT_UNIQUE)
 
+    @Slot()
     def _on_session_selected(self) -> None:
         # Export previous session before switching
         self.export_current_session()
@@ -53,6 +73,7 @@ class MainViewModel(QObject):
         else:
             self.chat_viewmodel.clear()
 
+    @Slot()
     def _on_workspace_selected(self) -> None:
         workspace = self.workspace_viewmodel.current_workspace
         if workspace and not self.workspace_viewmodel.sessions:
@@ -75,19 +96,21 @@ class MainViewModel(QObject):
         self.new_session()
 
     def initialize(self) -> None:
-        if not self.workspace_viewmodel.workspaces:
+        workspace_count, first_session = self.workspace_viewmodel.bootstrap()
+        if not workspace_count:
             self.new_workspace("Default Workspace")
-            return
-
-        if not self.workspace_viewmodel.sessions:
+        elif first_session is None:
             self.new_session()
-            return
-
-        first_session = self.workspace_viewmodel.sessions[0]
-        self.workspace_viewmodel.select_session(first_session.id)
+        else:
+            self.workspace_viewmodel.activate_session(first_session)
 
     def export_current_session(self) -> None:
-        """Export artifacts from the current session to disk."""
+        """Queue an export of the current session's artifacts to disk.
+
+        Does nothing when the view model was built without an artifact repository.
+        """
+        if self._artifact_repository is None:
+            return
         session_id = self.chat_viewmodel.current_session_id
         if not session_id:
             return
@@ -96,10 +119,11 @@ class MainViewModel(QObject):
         session = self.workspace_viewmodel.current_session
         session_title = session.title if session else "Untitled"
 
-        try:
-            exported = self._export_service.export_session(session_id, session_title)
-            if exported:
-                logger.info("Exported %d artifacts from session %s", len(exported), session_id)
-        except Exception as e:
-            logger.error("Failed to export session artifacts: %s", e)
+        self._exports.submit(session_id, session_title)
+
+    def shutdown(self) -> None:
+        """Export the current session and wait for all queued exports."""
+        self.export_current_session()
+        if self._export_queue is not None:
+            self._export_queue.stop()
 
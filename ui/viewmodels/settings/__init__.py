@@ -5,12 +5,12 @@ from .chatpdf_cleanup_service import ChatPDFCleanupService
 from .coordinator import SettingsCoordinator
 from .deep_search_settings import DeepSearchSettings
 from .global_rag_orchestrator import GlobalRAGOrchestrator
-from .model_settings import ModelSettings, DEFAULT_MODELS, DEFAULT_IMAGE_MODELS
+from .model_settings import DEFAULT_IMAGE_MODELS, DEFAULT_MODELS, ModelSettings
 from .rag_configuration_settings import RAGConfigurationSettings
-from .shortcuts_settings import ShortcutsSettings, DEFAULT_SHORTCUT_DEFINITIONS
+from .shortcuts_settings import DEFAULT_SHORTCUT_DEFINITIONS, ShortcutsSettings
 from .ui_visibility_settings import UIVisibilitySettings
 
-__all__ = [
+__all__ = (
     "AppearanceSettings",
     "ChatPDFCleanupService",
     "DeepSearchSettings",
@@ -23,4 +23,4 @@ __all__ = [
     "DEFAULT_MODELS",
     "DEFAULT_IMAGE_MODELS",
     "DEFAULT_SHORTCUT_DEFINITIONS",
-]
+)
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Optional
 
 from PySide6.QtCore import QObject, Signal
 
 from core.models import ThemeMode
-from core.persistence import Database, SettingsRepository
+from core.persistence import (
+    Database,
+    SettingsRepository,
+    get_shared_settings_repository,
+)
+
+_THEME_BY_NAME: dict[str, ThemeMode] = {mode.value: mode for mode in ThemeMode}
 
 
 class AppearanceSettings(QObject):
@@ -27,10 +33,14 @@ class AppearanceSettings(QObject):
         self,
         database: Optional[Database] = None,
         parent: Optional[QObject] = None,
+        change_sink: Optional[Callable[[], None]] = None,
     ):
         super().__init__(parent)
-        self._db = database or Database()
-        self._repo = SettingsRepository(self._db)
+        self._change_sink = change_sink
+        self._unsaved_changes = False
+        # Database/repository are created on first load()/save()
+        self._database = database
+        self._settings_repo: Optional[SettingsRepository] = None
 
         # Internal state
         self._theme_mode: ThemeMode = ThemeMode.DARK
@@ -38,6 +48,13 @@ class AppearanceSettings(QObject):
         self._transparency: int = 100
         self._keep_above: bool = False
 
+    @property
+    def _repo(self) -> SettingsRepository:
+        """Settings repository, created on first use."""
+        if self._settings_repo is None:
+            self._settings_repo = get_shared_settings_repository(self._database)
+        return self._settings_repo
+
     @property
     def theme_mode(self) -> ThemeMode:
         """Get current theme mode."""
@@ -46,15 +63,18 @@ class AppearanceSettings(QObject):
     @theme_mode.setter
     def theme_mode(self, value: ThemeMode | str) -> None:
         """Set theme mode."""
-        try:
-            mode = value if isinstance(value, ThemeMode) else ThemeMode(str(value).lower())
-        except (ValueError, TypeError):
-            mode = ThemeMode.DARK
+        if isinstance(value, ThemeMode):
+            mode = value
+        else:
+            try:
+                mode = _THEME_BY_NAME[value.lower()]
+            except (AttributeError, KeyError):
+                mode = ThemeMode.DARK
 
         if self._theme_mode != mode:
             self._theme_mode = mode
             self.theme_changed.emit(mode)
-            self.settings_changed.emit()
+            self._notify_changed()
 
     @property
     def font_family(self) -> str:
@@ -66,7 +86,7 @@ class AppearanceSettings(QObject):
         """Set font family."""
         if value and self._font_family != value:
             self._font_family = value
-            self.settings_changed.emit()
+            self._notify_changed()
 
     @property
     def transparency(self) -> int:
@@ -80,7 +100,7 @@ class AppearanceSettings(QObject):
         if self._transparency != value:
             self._transparency = value
             self.transparency_changed.emit(value)
-            self.settings_changed.emit()
+            self._notify_changed()
 
     @property
     def keep_above(self) -> bool:
@@ -93,26 +113,45 @@ class AppearanceSettings(QObject):
         if self._keep_above != bool(value):
             self._keep_above = bool(value)
             self.keep_above_changed.emit(self._keep_above)
-            self.settings_changed.emit()
+            self._notify_changed()
 
     def load(self) -> None:
         """Load appearance settings from database."""
-        theme_value = self._repo.get_value(self.KEY_THEME_MODE, ThemeMode.DARK.value)
+        values = self._repo.get_values(
+            (
+                self.KEY_THEME_MODE,
+                self.KEY_FONT_FAMILY,
+                self.KEY_TRANSPARENCY,
+                self.KEY_KEEP_ABOVE,
+            )
+        )
         try:
-            self._theme_mode = ThemeMode(theme_value)
+            self._theme_mode = ThemeMode(
+                values.get(self.KEY_THEME_MODE, ThemeMode.DARK.value)
+            )
         except ValueError:
             self._theme_mode = ThemeMode.DARK
 
-        self._font_family = self._repo.get_value(self.KEY_FONT_FAMILY, "Segoe UI")
-        self._transparency = self._repo.get_int(self.KEY_TRANSPARENCY, 100)
-        self._keep_above = self._repo.get_bool(self.KEY_KEEP_ABOVE, False)
+        self._font_family = values.get(self.KEY_FONT_FAMILY, "Segoe UI")
+        self._transparency = self._repo.parse_int(
+            values.get(self.KEY_TRANSPARENCY), 100
+        )
+        self._keep_above = self._repo.parse_bool(values.get(self.KEY_KEEP_ABOVE), False)
+        self._unsaved_changes = False
 
     def save(self) -> None:
         """Save appearance settings to database."""
-        self._repo.set(self.KEY_THEME_MODE, self._theme_mode.value, "theme")
-        self._repo.set(self.KEY_FONT_FAMILY, self._font_family, "theme")
-        self._repo.set(self.KEY_TRANSPARENCY, str(self._transparency), "theme")
-        self._repo.set(self.KEY_KEEP_ABOVE, str(self._keep_above).lower(), "theme")
+        if not self._unsaved_changes:
+            return
+        self._repo.set_many(
+            [
+                (self.KEY_THEME_MODE, self._theme_mode.value, "theme"),
+                (self.KEY_FONT_FAMILY, self._font_family, "theme"),
+                (self.KEY_TRANSPARENCY, self._transparency, "theme"),
+                (self.KEY_KEEP_ABOVE, self._keep_above, "theme"),
+            ]
+        )
+        self._unsaved_changes = False
 
     def snapshot(self) -> dict[str, object]:
         """Create snapshot of current state for revert functionality."""
@@ -124,14 +163,44 @@ class AppearanceSettings(QObject):
         }
 
     def restore_snapshot(self, snapshot: dict[str, object]) -> None:
-        """Restore state from snapshot, emitting signals for changes."""
-        self._theme_mode = snapshot.get("theme_mode", ThemeMode.DARK)
-        self._font_family = snapshot.get("font_family", "Segoe UI")
-        self._transparency = int(snapshot.get("transparency", 100))
-        self._keep_above = bool(snapshot.get("keep_above", False))
-
-        # Emit signals to notify UI
-        self.theme_changed.emit(self._theme_mode)
-        self.transparency_changed.emit(self._transparency)
-        self.keep_above_changed.emit(self._keep_above)
+        """Restore state from snapshot, emitting signals only for changed values."""
+        theme_mode = snapshot.get("theme_mode", ThemeMode.DARK)
+        font_family = snapshot.get("font_family", "Segoe UI")
+        transparency = int(snapshot.get("transparency", 100))
+        keep_above = bool(snapshot.get("keep_above", False))
+
+        changed = False
+        if self._theme_mode != theme_mode:
+            self._theme_mode = theme_mode
+            self.theme_changed.emit(theme_mode)
+            changed = True
+        if self._font_family != font_family:
+            self._font_family = font_family
+            changed = True
+        if self._transparency != transparency:
+            self._transparency = transparency
+            self.transparency_changed.emit(transparency)
+            changed = True
+        if self._keep_above != keep_above:
+            self._keep_above = keep_above
+            self.keep_above_changed.emit(keep_above)
+            changed = True
+
+        if changed:
+            self._notify_changed()
+
+    def _notify_changed(self) -> None:
+        """Report a change to the owner's change sink, then emit settings_changed."""
+        self._unsaved_changes = True
+        if self._change_sink is not None:
+            self._change_sink()
         self.settings_changed.emit()
+
+    @property
+    def has_unsaved_changes(self) -> bool:
+        """Whether changes since the last load or save are not yet persisted."""
+        return self._unsaved_changes
+
+    def mark_unsaved(self) -> None:
+        """Flag the current state as not persisted, e.g. after a rolled-back save."""
+        self._unsaved_changes = True
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, TYPE_CHECKING
 
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
 
-from core.persistence import Database, RagRepository
+from core.persistence import Database, RagRepository, get_shared_database
 
 if TYPE_CHECKING:
     from core.services.chroma_service import ChromaService
@@ -17,12 +18,34 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+UNLINK_MAX_WORKERS = 4
+
+# QTimer intervals are signed 32-bit milliseconds (~24.8 days)
+_MAX_TIMER_INTERVAL_MS = 2**31 - 1
+
+# Shortest wait before a scheduled cleanup. A stale document that cannot be
+# removed stays overdue, and without a floor the timer would re-arm at 0 ms.
+MIN_CLEANUP_INTERVAL_MS = 60 * 1000
+# Longest back-off after scheduled runs that removed nothing (once a day)
+MAX_CLEANUP_BACKOFF_MS = 24 * 60 * 60 * 1000
+
+
+def _safe_unlink(source_path: str) -> bool:
+    """Delete a file, returning False instead of raising on filesystem errors."""
+    try:
+        Path(source_path).unlink(missing_ok=True)
+    except OSError as exc:
+        logger.debug(f"Failed to delete file {source_path}: {exc}")
+        return False
+    return True
+
 
 class ChatPDFCleanupService(QObject):
     """
     Manages automatic cleanup of stale ChatPDF documents.
 
-    Runs periodic cleanup based on retention days configuration.
+    Cleanup is scheduled for the moment the oldest stale document passes the
+    retention window, so the timer only fires when there is work to do.
     """
 
     chatpdf_cleanup_complete = Signal(int)  # Number of documents removed
@@ -36,15 +59,42 @@ class ChatPDFCleanupService(QObject):
     ):
         super().__init__(parent)
         self._rag_config = rag_config
-        self._db = database or Database()
+        self._db = database or get_shared_database()
         self._chroma_service = chroma_service
         self._rag_repository = RagRepository(self._db)
 
-        # Setup periodic cleanup timer (24 hours)
+        self._scheduled_retention_days: Optional[int] = None
+        self._running = False
+        self._min_delay_ms = MIN_CLEANUP_INTERVAL_MS
+
+        # Single-shot timer armed for the next retention boundary
         self._cleanup_timer = QTimer(self)
-        self._cleanup_timer.setInterval(24 * 60 * 60 * 1000)  # 24 hours in ms
-        self._cleanup_timer.timeout.connect(self._run_cleanup)
-        self._cleanup_timer.start()
+        self._cleanup_timer.setSingleShot(True)
+        self._cleanup_timer.timeout.connect(self._on_cleanup_timeout, Qt.UniqueConnection)
+        self._rag_config.settings_changed.connect(
+            self._on_rag_config_changed, Qt.UniqueConnection
+        )
+        self.schedule_next_cleanup()
+
+    def schedule_next_cleanup(self) -> None:
+        """Arm the cleanup timer for the next time a document becomes expired.
+
+        Documents marked stale later can expire no sooner than one retention
+        period from now, so that is the wait when nothing is stale yet. The
+        wait never drops below the current floor, which starts at
+        MIN_CLEANUP_INTERVAL_MS and backs off while runs remove nothing.
+        """
+        retention_days = self._rag_config.rag_chatpdf_retention_days
+        retention = timedelta(days=retention_days)
+        earliest_stale_at = self._rag_repository.get_earliest_stale_at()
+        if earliest_stale_at is None:
+            delay = retention
+        else:
+            delay = max(timedelta(0), earliest_stale_at + retention - datetime.now())
+        delay_ms = max(int(delay.total_seconds() * 1000), self._min_delay_ms)
+        delay_ms = min(delay_ms, _MAX_TIMER_INTERVAL_MS)
+        self._scheduled_retention_days = retention_days
+        self._cleanup_timer.start(delay_ms)
 
     def cleanup_chatpdf_documents(self) -> int:
         """
@@ -54,12 +104,46 @@ class ChatPDFCleanupService(QObject):
             Number of documents removed.
         """
         removed = self._run_cleanup()
+        if self._cleanup_timer.isActive():
+            self.schedule_next_cleanup()
         self.chatpdf_cleanup_complete.emit(removed)
         return removed
 
+    def _on_cleanup_timeout(self) -> None:
+        """Run the scheduled cleanup and arm the timer for the next boundary."""
+        if self._run_cleanup():
+            self._min_delay_ms = MIN_CLEANUP_INTERVAL_MS
+        else:
+            # The overdue document is still there; wait longer before retrying
+            self._min_delay_ms = min(self._min_delay_ms * 2, MAX_CLEANUP_BACKOFF_MS)
+        self.schedule_next_cleanup()
+
+    def _on_rag_config_changed(self) -> None:
+        """Re-arm the timer when the retention window changes."""
+        if not self._cleanup_timer.isActive():
+            return
+        if self._rag_config.rag_chatpdf_retention_days != self._scheduled_retention_days:
+            self.schedule_next_cleanup()
+
     def _run_cleanup(self) -> int:
         """
-        Run cleanup of stale ChatPDF documents.
+        Run cleanup unless one is already in flight.
+
+        Returns:
+            Number of documents removed (0 when skipped).
+        """
+        if self._running:
+            logger.debug("ChatPDF cleanup already running; skipping")
+            return 0
+        self._running = True
+        try:
+            return self._remove_stale_documents()
+        finally:
+            self._running = False
+
+    def _remove_stale_documents(self) -> int:
+        """
+        Remove stale ChatPDF documents.
 
         Deletes documents older than retention days from:
         - Filesystem (PDF files)
@@ -71,39 +155,53 @@ class ChatPDFCleanupService(QObject):
         """
         retention_days = self._rag_config.rag_chatpdf_retention_days
         cutoff = datetime.now() - timedelta(days=retention_days)
-        stale_docs = self._rag_repository.list_stale_documents(cutoff)
-
-        removed = 0
-        for doc in stale_docs:
-            # Delete PDF file from filesystem
-            if doc.source_path:
-                try:
-                    Path(doc.source_path).unlink(missing_ok=True)
-                except OSError as exc:
-                    logger.warning(
-                        f"Failed to delete file {doc.source_path}: {exc}"
-                    )
-
-            # Delete from SQLite
-            try:
-                self._rag_repository.delete_document(doc.id)
-            except Exception as exc:
-                logger.error(
-                    f"Failed to delete document {doc.id} from database: {exc}"
-                )
-                continue
-
-            # Delete from ChromaDB (if available)
-            if self._chroma_service is not None:
+        stale_refs = self._rag_repository.list_stale_document_refs(cutoff)
+        if not stale_refs:
+            return 0
+
+        # Phase 1: delete PDF files; unlinks are independent, so overlap them
+        source_paths = [source_path for _doc_id, source_path in stale_refs if source_path]
+        if len(source_paths) > 1:
+            with ThreadPoolExecutor(max_workers=UNLINK_MAX_WORKERS) as executor:
+                unlinked = list(executor.map(_safe_unlink, source_paths))
+        else:
+            unlinked = [_safe_unlink(source_path) for source_path in source_paths]
+        fs_failures = unlinked.count(False)
+
+        # Phase 2: delete from SQLite in one transaction; fall back per
+        # document so a single bad row does not block the rest of the cleanup
+        doc_ids = [doc_id for doc_id, _source_path in stale_refs]
+        try:
+            self._rag_repository.delete_documents(doc_ids)
+            removed_ids = doc_ids
+        except Exception as exc:
+            logger.debug(f"Bulk delete of stale documents failed: {exc}")
+            removed_ids = []
+            for doc_id in doc_ids:
                 try:
-                    self._chroma_service.delete_by_document(doc.id)
+                    self._rag_repository.delete_document(doc_id)
                 except Exception as exc:
-                    logger.warning(
-                        f"Failed to delete document {doc.id} from ChromaDB: {exc}"
-                    )
-
-            removed += 1
+                    logger.debug(f"Failed to delete document {doc_id}: {exc}")
+                    continue
+                removed_ids.append(doc_id)
+        db_failures = len(doc_ids) - len(removed_ids)
+
+        # Phase 3: delete vectors from ChromaDB (if available)
+        chroma_failures = 0
+        if self._chroma_service is not None and removed_ids:
+            # The service logs its own errors and reports failure by return value
+            if not self._chroma_service.delete_by_documents(removed_ids):
+                chroma_failures = len(removed_ids)
+
+        if fs_failures or db_failures or chroma_failures:
+            logger.warning(
+                "ChatPDF cleanup: %d file, %d database, %d ChromaDB failures",
+                fs_failures,
+                db_failures,
+                chroma_failures,
+            )
 
+        removed = len(removed_ids)
         if removed > 0:
             logger.info(
                 f"Cleaned up {removed} stale ChatPDF documents "
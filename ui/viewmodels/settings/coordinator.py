@@ -7,13 +7,15 @@ this will replace SettingsViewModel entirely.
 
 from __future__ import annotations
 
-from typing import Optional
+from contextlib import contextmanager
+from functools import cached_property, partial
+from types import MappingProxyType
+from typing import Iterator, Mapping, Optional
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
 
-from core.models import ThemeMode
-from core.persistence import Database
-from core.infrastructure.keyring_service import KeyringService, get_keyring_service
+from core.persistence import Database, get_shared_database
+from core.infrastructure.keyring_service import KeyringService
 
 from .appearance_settings import AppearanceSettings
 from .chatpdf_cleanup_service import ChatPDFCleanupService
@@ -25,6 +27,42 @@ from .shortcuts_settings import ShortcutsSettings, DEFAULT_SHORTCUT_DEFINITIONS
 from .ui_visibility_settings import UIVisibilitySettings
 
 
+class _Delegate:
+    """Descriptor forwarding a coordinator attribute to a subsystem attribute."""
+
+    __slots__ = ("_subsystem", "_name", "_writable")
+
+    def __init__(self, subsystem: str, name: Optional[str] = None, *, writable: bool = True):
+        self._subsystem = subsystem
+        self._name = name
+        self._writable = writable
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        if self._name is None:
+            self._name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(getattr(obj, self._subsystem), self._name)
+
+    def __set__(self, obj, value) -> None:
+        if not self._writable:
+            raise AttributeError(f"{self._subsystem}.{self._name} is read-only")
+        setattr(getattr(obj, self._subsystem), self._name, value)
+
+
+# Subsystems that take part in snapshot()/restore_snapshot(), keyed by attribute
+_SNAPSHOT_SUBSYSTEMS = (
+    "appearance",
+    "shortcuts",
+    "ui_visibility",
+    "models",
+    "deep_search",
+    "rag_config",
+)
+
+
 class SettingsCoordinator(QObject):
     """
     Facade coordinating all settings subsystems.
@@ -34,17 +72,19 @@ class SettingsCoordinator(QObject):
     Phase 3: RAG configuration, Global RAG orchestrator, ChatPDF cleanup
     """
 
-    # Forward signals from subsystems
-    theme_changed = Signal(ThemeMode)
-    transparency_changed = Signal(int)
-    keep_above_changed = Signal(bool)
-    shortcuts_changed = Signal()
-    deep_search_toggled = Signal(bool)
-    global_rag_progress = Signal(int, int, str)
-    global_rag_complete = Signal(object)
-    global_rag_error = Signal(str)
-    global_rag_registry_updated = Signal()
-    chatpdf_cleanup_complete = Signal(int)
+    # Subsystem signals, exposed directly so listeners connect to the source
+    theme_changed = _Delegate("appearance", writable=False)
+    transparency_changed = _Delegate("appearance", writable=False)
+    keep_above_changed = _Delegate("appearance", writable=False)
+    shortcuts_changed = _Delegate("shortcuts", writable=False)
+    deep_search_toggled = _Delegate("deep_search", writable=False)
+    global_rag_progress = _Delegate("global_rag", writable=False)
+    global_rag_complete = _Delegate("global_rag", writable=False)
+    global_rag_error = _Delegate("global_rag", writable=False)
+    global_rag_registry_updated = _Delegate("global_rag", writable=False)
+    chatpdf_cleanup_complete = _Delegate("chatpdf_cleanup", writable=False)
+
+    # Aggregated signals
     settings_changed = Signal()
     settings_saved = Signal()
     error_occurred = Signal(str)
@@ -59,180 +99,253 @@ class SettingsCoordinator(QObject):
         super().__init__(parent)
 
         # Shared dependencies
-        self._db = database or Database()
-        self._keyring = keyring_service or get_keyring_service()
+        self._db = database or get_shared_database()
+        # Resolved by the Phase 2 subsystems when they are first built
+        self._keyring_service = keyring_service
         self._chroma = chroma_service
 
+        # Per-subsystem snapshots, rebuilt only for subsystems that changed
+        self._snapshot_cache: dict[str, object] = {}
+        self._dirty: set[str] = set()
+
+        # settings_changed is coalesced into one emission per event-loop pass,
+        # and held back entirely while a batch is open
+        self._batch_depth = 0
+        self._pending_changed = False
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self.flush_settings_changed)
+
+        # Subsystems report changes straight to the coordinator through their
+        # change sink instead of a settings_changed connection per subsystem
+        sink = self._change_sink
+
         # Phase 1 subsystems
-        self.appearance = AppearanceSettings(self._db, parent=self)
-        self.shortcuts = ShortcutsSettings(self._db, parent=self)
-        self.ui_visibility = UIVisibilitySettings(self._db, parent=self)
+        self.appearance = AppearanceSettings(
+            self._db, parent=self, change_sink=sink("appearance")
+        )
+        self.shortcuts = ShortcutsSettings(
+            self._db, parent=self, change_sink=sink("shortcuts")
+        )
+        self.ui_visibility = UIVisibilitySettings(
+            self._db, parent=self, change_sink=sink("ui_visibility")
+        )
 
-        # Phase 2 subsystems
-        self.models = ModelSettings(self._db, self._keyring, parent=self)
-        self.deep_search = DeepSearchSettings(self._db, self._keyring, parent=self)
+        # Phase 2: the main window reads deep_search_enabled and connects
+        # deep_search_toggled at startup, so deep search is built eagerly; its
+        # construction reads nothing and the keyring is only probed on load.
+        # Model settings and the global RAG orchestrator are built on first
+        # access (see the cached properties below).
+        self.deep_search = DeepSearchSettings(
+            self._db, self._keyring_service, parent=self,
+            change_sink=sink("deep_search"),
+        )
 
-        # Phase 3 subsystems
-        self.rag_config = RAGConfigurationSettings(self._db, parent=self)
-        self.global_rag = GlobalRAGOrchestrator(
-            self.rag_config, self.models, self._db, self._chroma, parent=self
+        # Phase 3 subsystems; the cleanup service arms its retention timer on
+        # construction, so it and its configuration stay eager.
+        self.rag_config = RAGConfigurationSettings(
+            self._db, parent=self, change_sink=sink("rag_config")
         )
         self.chatpdf_cleanup = ChatPDFCleanupService(
             self.rag_config, self._db, self._chroma, parent=self
         )
+        self._dirty.update(self._materialized_subsystems())
 
-        # Track saved state for revert
+        # Track saved state for revert; entries are the same read-only
+        # snapshots held in _snapshot_cache, so unchanged subsystems are
+        # never duplicated
         self._saved_state: dict[str, object] = {}
+        self._loaded = False
+
+    @cached_property
+    def models(self) -> ModelSettings:
+        """Model settings (Phase 2), built on first access."""
+        return self._adopt_subsystem(
+            "models",
+            ModelSettings(
+                self._db, self._keyring_service, parent=self,
+                change_sink=self._change_sink("models"),
+            ),
+        )
 
-        # Wire up signal forwarding
-        self._connect_signals()
-
-    def _connect_signals(self) -> None:
-        """Forward signals from subsystems to coordinator."""
-        # Appearance signals
-        self.appearance.theme_changed.connect(self.theme_changed)
-        self.appearance.transparency_changed.connect(self.transparency_changed)
-        self.appearance.keep_above_changed.connect(self.keep_above_changed)
-        self.appearance.settings_changed.connect(self.settings_changed)
-
-        # Shortcuts signals
-        self.shortcuts.shortcuts_changed.connect(self.shortcuts_changed)
-        self.shortcuts.settings_changed.connect(self.settings_changed)
-
-        # UI visibility signals
-        self.ui_visibility.settings_changed.connect(self.settings_changed)
-
-        # Model settings signals
-        self.models.settings_changed.connect(self.settings_changed)
-
-        # Deep search signals
-        self.deep_search.deep_search_toggled.connect(self.deep_search_toggled)
-        self.deep_search.settings_changed.connect(self.settings_changed)
+    @cached_property
+    def global_rag(self) -> GlobalRAGOrchestrator:
+        """Global RAG orchestrator (Phase 3), built on first access."""
+        return GlobalRAGOrchestrator(
+            self.rag_config, self.models, self._db, self._chroma, parent=self
+        )
 
-        # RAG configuration signals
-        self.rag_config.settings_changed.connect(self.settings_changed)
+    def _adopt_subsystem(self, name: str, subsystem: QObject) -> QObject:
+        """Bring a lazily built subsystem up to the coordinator's current state."""
+        if self._loaded:
+            subsystem.load()
+        frozen = MappingProxyType(subsystem.snapshot())
+        self._snapshot_cache[name] = frozen
+        if self._saved_state:
+            # Nothing has changed since it was built, so this is its saved state
+            self._saved_state[name] = frozen
+        return subsystem
+
+    def _materialized_subsystems(self) -> list[str]:
+        """Names of the snapshot subsystems that have been constructed."""
+        return [name for name in _SNAPSHOT_SUBSYSTEMS if name in self.__dict__]
+
+    def _update_monitoring_state(self) -> None:
+        """Sync the folder watcher, building the orchestrator only if monitoring is on."""
+        if "global_rag" in self.__dict__ or self.rag_config.rag_global_monitoring_enabled:
+            self.global_rag.update_monitoring_state()
+
+    def _change_sink(self, name: str) -> partial:
+        """Build the change callback handed to one subsystem."""
+        return partial(self._on_subsystem_changed, name)
+
+    def _on_subsystem_changed(self, name: str) -> None:
+        """Invalidate one subsystem's snapshot and schedule settings_changed.
+
+        The cached snapshot is dropped immediately; listeners hear about a burst
+        of changes once, on the next event-loop pass or when a batch closes.
+        """
+        self._dirty.add(name)
+        self._pending_changed = True
+        if not self._batch_depth and not self._emit_timer.isActive():
+            self._emit_timer.start()
+
+    def flush_settings_changed(self) -> None:
+        """Emit a pending coalesced settings_changed now instead of next loop pass."""
+        self._emit_timer.stop()
+        if self._pending_changed:
+            self._pending_changed = False
+            self.settings_changed.emit()
+
+    @contextmanager
+    def _batch_changes(self) -> Iterator[None]:
+        """Coalesce settings_changed into one emission for a multi-subsystem operation."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush_settings_changed()
 
-        # Global RAG orchestrator signals
-        self.global_rag.global_rag_progress.connect(self.global_rag_progress)
-        self.global_rag.global_rag_complete.connect(self.global_rag_complete)
-        self.global_rag.global_rag_error.connect(self.global_rag_error)
-        self.global_rag.global_rag_registry_updated.connect(self.global_rag_registry_updated)
+    def load_settings(self) -> None:
+        """Load all settings from database.
 
-        # ChatPDF cleanup signals
-        self.chatpdf_cleanup.chatpdf_cleanup_complete.connect(self.chatpdf_cleanup_complete)
+        Subsystems that have not been built yet load themselves on first access.
+        """
+        self._loaded = True
+        materialized = self._materialized_subsystems()
+        # load() does not emit settings_changed, so invalidate explicitly
+        self._dirty.update(materialized)
 
-    def load_settings(self) -> None:
-        """Load all settings from database."""
-        self.appearance.load()
-        self.shortcuts.load()
-        self.ui_visibility.load()
-        self.models.load()
-        self.deep_search.load()
-        self.rag_config.load()
+        # Subsystems are QObjects owned by this thread and share one keyring
+        # service, so they all load here rather than on worker threads
+        for name in materialized:
+            getattr(self, name).load()
 
         # Initialize Phase 3 orchestrators after config is loaded
-        self.global_rag.update_monitoring_state()
+        self._update_monitoring_state()
+        self.chatpdf_cleanup.schedule_next_cleanup()
 
         self._saved_state = self.snapshot()
 
     def save_settings(self) -> None:
         """Save all settings to database."""
         try:
-            self.appearance.save()
-            self.shortcuts.save()
-            self.ui_visibility.save()
-            self.models.save()
-            self.deep_search.save()
-            self.rag_config.save()
-            self._saved_state = self.snapshot()
+            with self._batch_changes():
+                current = self._current_snapshots()
+                # One commit for every subsystem; a failure leaves the database
+                # untouched. Only write subsystems that differ from the last
+                # saved state; subsystems that were never built have nothing to
+                # save. Unchanged subsystems share the saved snapshot object,
+                # so the identity check settles them without comparing contents.
+                attempted = []
+                try:
+                    with self._db.transaction():
+                        for name in self._materialized_subsystems():
+                            saved = self._saved_state.get(name)
+                            if saved is not current[name] and saved != current[name]:
+                                attempted.append(name)
+                                getattr(self, name).save()
+                except Exception:
+                    # The rollback discarded their writes; keep them saveable
+                    for name in attempted:
+                        getattr(self, name).mark_unsaved()
+                    raise
+                # Subsystems with writes still pending (e.g. a failed keyring
+                # write) keep their previous saved state so the next save
+                # retries them
+                saved_state = self.snapshot()
+                for name in attempted:
+                    if not getattr(self, name).has_unsaved_changes:
+                        continue
+                    if name in self._saved_state:
+                        saved_state[name] = self._saved_state[name]
+                    else:
+                        del saved_state[name]
+                self._saved_state = saved_state
             self.settings_saved.emit()
         except Exception as exc:
             self.error_occurred.emit(str(exc))
 
     def snapshot(self) -> dict[str, object]:
-        """Create snapshot of all settings for revert functionality."""
-        return {
-            "appearance": self.appearance.snapshot(),
-            "shortcuts": self.shortcuts.snapshot(),
-            "ui_visibility": self.ui_visibility.snapshot(),
-            "models": self.models.snapshot(),
-            "deep_search": self.deep_search.snapshot(),
-            "rag_config": self.rag_config.snapshot(),
-        }
-
-    def restore_snapshot(self, snapshot: dict[str, object]) -> None:
-        """Restore all settings from snapshot."""
-        if "appearance" in snapshot:
-            self.appearance.restore_snapshot(snapshot["appearance"])
-        if "shortcuts" in snapshot:
-            self.shortcuts.restore_snapshot(snapshot["shortcuts"])
-        if "ui_visibility" in snapshot:
-            self.ui_visibility.restore_snapshot(snapshot["ui_visibility"])
-        if "models" in snapshot:
-            self.models.restore_snapshot(snapshot["models"])
-        if "deep_search" in snapshot:
-            self.deep_search.restore_snapshot(snapshot["deep_search"])
-        if "rag_config" in snapshot:
-            self.rag_config.restore_snapshot(snapshot["rag_config"])
-
-        # Update monitoring state after restore
-        self.global_rag.update_monitoring_state()
+        """Create snapshot of all settings for revert functionality.
+
+        Subsystem snapshots are cached and shared between calls until that
+        subsystem reports a change, so they are returned as read-only
+        mappings.
+        """
+        return dict(self._current_snapshots())
+
+    def _current_snapshots(self) -> dict[str, object]:
+        """Bring the snapshot cache up to date and return it without copying.
+
+        For internal reads that finish before any subsystem can change again;
+        anything kept (like the saved state) must go through snapshot().
+        """
+        for name in self._dirty:
+            self._snapshot_cache[name] = MappingProxyType(getattr(self, name).snapshot())
+        self._dirty.clear()
+        return self._snapshot_cache
+
+    def restore_snapshot(self, snapshot: Mapping[str, object]) -> None:
+        """Restore all settings from snapshot (emits settings_changed at most once).
+
+        The snapshot is only read, so read-only mappings can be passed as is.
+        Subsystems whose state already matches are skipped, so restoring an
+        unchanged state emits nothing.
+        """
+        current = self._current_snapshots()
+        with self._batch_changes():
+            for name in _SNAPSHOT_SUBSYSTEMS:
+                if name not in snapshot:
+                    continue
+                part = snapshot[name]
+                if part is current.get(name) or part == current.get(name):
+                    continue
+                getattr(self, name).restore_snapshot(part)
+
+            # Update monitoring state after restore
+            self._update_monitoring_state()
 
     def revert_to_saved(self) -> None:
         """Restore all settings to last saved state."""
-        self.restore_snapshot(self._saved_state.copy())
+        with self._batch_changes():
+            # Read-only view: restoring must not alter the saved state
+            self.restore_snapshot(MappingProxyType(self._saved_state))
 
-    # Convenience properties for backward compatibility
+    # Convenience properties for backward compatibility. Each access forwards
+    # through two descriptors; widgets bound to a single subsystem should use
+    # it directly (e.g. coordinator.deep_search.exa_api_key).
 
-    @property
-    def theme_mode(self) -> ThemeMode:
-        """Get current theme mode."""
-        return self.appearance.theme_mode
+    theme_mode = _Delegate("appearance")
+    font_family = _Delegate("appearance")
+    transparency = _Delegate("appearance")
+    keep_above = _Delegate("appearance")
 
-    @theme_mode.setter
-    def theme_mode(self, value: ThemeMode | str) -> None:
-        """Set theme mode."""
-        self.appearance.theme_mode = value
-
-    @property
-    def font_family(self) -> str:
-        """Get font family."""
-        return self.appearance.font_family
-
-    @font_family.setter
-    def font_family(self, value: str) -> None:
-        """Set font family."""
-        self.appearance.font_family = value
-
-    @property
-    def transparency(self) -> int:
-        """Get window transparency."""
-        return self.appearance.transparency
-
-    @transparency.setter
-    def transparency(self, value: int) -> None:
-        """Set window transparency."""
-        self.appearance.transparency = value
-
-    @property
-    def keep_above(self) -> bool:
-        """Get keep above flag."""
-        return self.appearance.keep_above
-
-    @keep_above.setter
-    def keep_above(self, value: bool) -> None:
-        """Set keep above flag."""
-        self.appearance.keep_above = value
-
-    @property
-    def shortcut_definitions(self):
-        """Get shortcut definitions."""
-        return self.shortcuts.shortcut_definitions
-
-    @property
-    def shortcut_bindings(self) -> dict[str, str]:
-        """Get shortcut bindings."""
-        return self.shortcuts.shortcut_bindings
+    shortcut_definitions = _Delegate("shortcuts", writable=False)
+    shortcut_bindings = _Delegate("shortcuts", writable=False)
 
     def get_shortcut_sequence(self, action_id: str) -> str:
         """Get key sequence for action."""
@@ -246,257 +359,50 @@ class SettingsCoordinator(QObject):
         """Reset shortcuts to defaults."""
         self.shortcuts.reset_shortcuts()
 
-    @property
-    def sidebar_visible(self) -> bool:
-        """Get sidebar visibility."""
-        return self.ui_visibility.sidebar_visible
-
-    @sidebar_visible.setter
-    def sidebar_visible(self, value: bool) -> None:
-        """Set sidebar visibility."""
-        self.ui_visibility.sidebar_visible = value
-
-    @property
-    def artifact_panel_visible(self) -> bool:
-        """Get artifact panel visibility."""
-        return self.ui_visibility.artifact_panel_visible
-
-    @artifact_panel_visible.setter
-    def artifact_panel_visible(self, value: bool) -> None:
-        """Set artifact panel visibility."""
-        self.ui_visibility.artifact_panel_visible = value
+    sidebar_visible = _Delegate("ui_visibility")
+    artifact_panel_visible = _Delegate("ui_visibility")
 
     # Phase 2 backward compatibility properties
 
-    @property
-    def keyring_available(self) -> bool:
-        """Check if keyring backend is available."""
-        return self.models.keyring_available
-
-    @property
-    def has_openrouter_key(self) -> bool:
-        """Check if OpenRouter API key is configured."""
-        return self.models.has_openrouter_key
-
-    @property
-    def api_key(self) -> str:
-        """Get OpenRouter API key."""
-        return self.models.api_key
-
-    @api_key.setter
-    def api_key(self, value: str) -> None:
-        """Set OpenRouter API key."""
-        self.models.api_key = value
-
-    @property
-    def default_model(self) -> str:
-        """Get default LLM model."""
-        return self.models.default_model
-
-    @default_model.setter
-    def default_model(self, value: str) -> None:
-        """Set default LLM model."""
-        self.models.default_model = value
-
-    @property
-    def image_model(self) -> str:
-        """Get image/multimodal model."""
-        return self.models.image_model
-
-    @image_model.setter
-    def image_model(self, value: str) -> None:
-        """Set image/multimodal model."""
-        self.models.image_model = value
-
-    @property
-    def models_list(self) -> list[str]:
-        """Get list of available models."""
-        return self.models.models
+    keyring_available = _Delegate("models", writable=False)
+    has_openrouter_key = _Delegate("models", writable=False)
+    api_key = _Delegate("models")
+    default_model = _Delegate("models")
+    image_model = _Delegate("models")
+    models_list = _Delegate("models", "models", writable=False)
+    image_models_list = _Delegate("models", "image_models", writable=False)
 
     def add_model(self, model_id: str) -> None:
         """Add custom model to list."""
         self.models.add_model(model_id)
 
-    @property
-    def image_models_list(self) -> list[str]:
-        """Get list of available image models."""
-        return self.models.image_models
-
     def add_image_model(self, model_id: str) -> None:
         """Add custom image model to list."""
         self.models.add_image_model(model_id)
 
-    @property
-    def deep_search_enabled(self) -> bool:
-        """Get deep search enabled state."""
-        return self.deep_search.deep_search_enabled
-
-    @deep_search_enabled.setter
-    def deep_search_enabled(self, value: bool) -> None:
-        """Set deep search enabled state."""
-        self.deep_search.deep_search_enabled = value
-
-    @property
-    def exa_api_key(self) -> str:
-        """Get Exa API key."""
-        return self.deep_search.exa_api_key
-
-    @exa_api_key.setter
-    def exa_api_key(self, value: str) -> None:
-        """Set Exa API key."""
-        self.deep_search.exa_api_key = value
-
-    @property
-    def firecrawl_api_key(self) -> str:
-        """Get Firecrawl API key."""
-        return self.deep_search.firecrawl_api_key
-
-    @firecrawl_api_key.setter
-    def firecrawl_api_key(self, value: str) -> None:
-        """Set Firecrawl API key."""
-        self.deep_search.firecrawl_api_key = value
-
-    @property
-    def search_provider(self) -> str:
-        """Get search provider."""
-        return self.deep_search.search_provider
-
-    @search_provider.setter
-    def search_provider(self, value: str) -> None:
-        """Set search provider."""
-        self.deep_search.search_provider = value
-
-    @property
-    def deep_search_num_results(self) -> int:
-        """Get number of search results."""
-        return self.deep_search.deep_search_num_results
-
-    @deep_search_num_results.setter
-    def deep_search_num_results(self, value: int) -> None:
-        """Set number of search results."""
-        self.deep_search.deep_search_num_results = value
+    deep_search_enabled = _Delegate("deep_search")
+    exa_api_key = _Delegate("deep_search")
+    firecrawl_api_key = _Delegate("deep_search")
+    search_provider = _Delegate("deep_search")
+    deep_search_num_results = _Delegate("deep_search")
 
     # Phase 3 backward compatibility properties (RAG Configuration)
 
-    @property
-    def rag_enabled(self) -> bool:
-        """Get RAG enabled state."""
-        return self.rag_config.rag_enabled
-
-    @rag_enabled.setter
-    def rag_enabled(self, value: bool) -> None:
-        """Set RAG enabled state."""
-        self.rag_config.rag_enabled = value
-
-    @property
-    def rag_scope(self) -> str:
-        """Get RAG scope."""
-        return self.rag_config.rag_scope
-
-    @rag_scope.setter
-    def rag_scope(self, value: str) -> None:
-        """Set RAG scope."""
-        self.rag_config.rag_scope = value
-
-    @property
-    def rag_chunk_size_chars(self) -> int:
-        """Get chunk size."""
-        return self.rag_config.rag_chunk_size_chars
-
-    @rag_chunk_size_chars.setter
-    def rag_chunk_size_chars(self, value: int) -> None:
-        """Set chunk size."""
-        self.rag_config.rag_chunk_size_chars = value
+    rag_enabled = _Delegate("rag_config")
+    rag_scope = _Delegate("rag_config")
+    rag_chunk_size_chars = _Delegate("rag_config")
+    rag_chunk_overlap_chars = _Delegate("rag_config")
+    rag_k_lex = _Delegate("rag_config")
+    rag_k_vec = _Delegate("rag_config")
+    rag_rrf_k = _Delegate("rag_config")
+    rag_max_candidates = _Delegate("rag_config")
+    rag_embedding_model = _Delegate("rag_config")
+    rag_enable_query_rewrite = _Delegate("rag_config")
+    rag_enable_llm_rerank = _Delegate("rag_config")
+    rag_index_text_artifacts = _Delegate("rag_config")
+    rag_chatpdf_retention_days = _Delegate("rag_config")
 
-    @property
-    def rag_chunk_overlap_chars(self) -> int:
-        """Get chunk overlap."""
-        return self.rag_config.rag_chunk_overlap_chars
-
-    @rag_chunk_overlap_chars.setter
-    def rag_chunk_overlap_chars(self, value: int) -> None:
-        """Set chunk overlap."""
-        self.rag_config.rag_chunk_overlap_chars = value
-
-    @property
-    def rag_k_lex(self) -> int:
-        """Get lexical search k."""
-        return self.rag_config.rag_k_lex
-
-    @rag_k_lex.setter
-    def rag_k_lex(self, value: int) -> None:
-        """Set lexical search k."""
-        self.rag_config.rag_k_lex = value
-
-    @property
-    def rag_k_vec(self) -> int:
-        """Get vector search k."""
-        return self.rag_config.rag_k_vec
-
-    @rag_k_vec.setter
-    def rag_k_vec(self, value: int) -> None:
-        """Set vector search k."""
-        self.rag_config.rag_k_vec = value
-
-    @property
-    def rag_rrf_k(self) -> int:
-        """Get RRF constant."""
-        return self.rag_config.rag_rrf_k
-
-    @rag_rrf_k.setter
-    def rag_rrf_k(self, value: int) -> None:
-        """Set RRF constant."""
-        self.rag_config.rag_rrf_k = value
-
-    @property
-    def rag_max_candidates(self) -> int:
-        """Get max candidates."""
-        return self.rag_config.rag_max_candidates
-
-    @rag_max_candidates.setter
-    def rag_max_candidates(self, value: int) -> None:
-        """Set max candidates."""
-        self.rag_config.rag_max_candidates = value
-
-    @property
-    def rag_embedding_model(self) -> str:
-        """Get embedding model."""
-        return self.rag_config.rag_embedding_model
-
-    @rag_embedding_model.setter
-    def rag_embedding_model(self, value: str) -> None:
-        """Set embedding model."""
-        self.rag_config.rag_embedding_model = value
-
-    @property
-    def rag_enable_query_rewrite(self) -> bool:
-        """Get query rewrite enabled."""
-        return self.rag_config.rag_enable_query_rewrite
-
-    @rag_enable_query_rewrite.setter
-    def rag_enable_query_rewrite(self, value: bool) -> None:
-        """Set query rewrite enabled."""
-        self.rag_config.rag_enable_query_rewrite = value
-
-    @property
-    def rag_enable_llm_rerank(self) -> bool:
-        """Get LLM rerank enabled."""
-        return self.rag_config.rag_enable_llm_rerank
-
-    @rag_enable_llm_rerank.setter
-    def rag_enable_llm_rerank(self, value: bool) -> None:
-        """Set LLM rerank enabled."""
-        self.rag_config.rag_enable_llm_rerank = value
-
-    @property
-    def rag_index_text_artifacts(self) -> bool:
-        """Get text artifacts indexing enabled."""
-        return self.rag_config.rag_index_text_artifacts
-
-    @rag_index_text_artifacts.setter
-    def rag_index_text_artifacts(self, value: bool) -> None:
-        """Set text artifacts indexing enabled."""
-        self.rag_config.rag_index_text_artifacts = value
+    # Folder and monitoring changes also update the watcher, so they stay explicit
 
     @property
     def rag_global_folder(self) -> str:
@@ -506,9 +412,11 @@ class SettingsCoordinator(QObject):
     @rag_global_folder.setter
     def rag_global_folder(self, value: str) -> None:
         """Set global RAG folder (triggers monitoring update)."""
+        previous = self.rag_config.rag_global_folder
         self.rag_config.rag_global_folder = value
         # Update monitoring if folder changed
-        self.global_rag.update_monitoring_state()
+        if self.rag_config.rag_global_folder != previous:
+            self._update_monitoring_state()
 
     @property
     def rag_global_monitoring_enabled(self) -> bool:
@@ -518,19 +426,11 @@ class SettingsCoordinator(QObject):
     @rag_global_monitoring_enabled.setter
     def rag_global_monitoring_enabled(self, value: bool) -> None:
         """Set global monitoring enabled (triggers monitoring start/stop)."""
+        previous = self.rag_config.rag_global_monitoring_enabled
         self.rag_config.rag_global_monitoring_enabled = value
         # Update monitoring state
-        self.global_rag.update_monitoring_state()
-
-    @property
-    def rag_chatpdf_retention_days(self) -> int:
-        """Get ChatPDF retention days."""
-        return self.rag_config.rag_chatpdf_retention_days
-
-    @rag_chatpdf_retention_days.setter
-    def rag_chatpdf_retention_days(self, value: int) -> None:
-        """Set ChatPDF retention days."""
-        self.rag_config.rag_chatpdf_retention_days = value
+        if self.rag_config.rag_global_monitoring_enabled != previous:
+            self._update_monitoring_state()
 
     # Phase 3 Global RAG orchestrator methods
 
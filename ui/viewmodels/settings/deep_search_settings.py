@@ -2,12 +2,28 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from PySide6.QtCore import QObject, Signal
 
 from core.infrastructure.keyring_service import KeyringService, get_keyring_service
-from core.persistence import Database, SettingsRepository
+from core.persistence import (
+    Database,
+    get_shared_database,
+    get_shared_settings_repository,
+)
+
+from .tracked_field import TrackedField, clamped
+
+_SEARCH_PROVIDERS = frozenset({"exa", "firecrawl"})
+
+
+def _as_str(value: Any) -> str:
+    return value or ""
+
+
+def _as_provider(value: Any) -> str:
+    return value if value in _SEARCH_PROVIDERS else "exa"
 
 
 class DeepSearchSettings(QObject):
@@ -16,6 +32,14 @@ class DeepSearchSettings(QObject):
     deep_search_toggled = Signal(bool)
     settings_changed = Signal()
 
+    deep_search_enabled = TrackedField(bool, extra_signal="deep_search_toggled")
+    exa_api_key = TrackedField(_as_str)
+    firecrawl_api_key = TrackedField(_as_str)
+    # Search provider (exa or firecrawl)
+    search_provider = TrackedField(_as_provider)
+    # Number of search results, clamped to 1-20
+    deep_search_num_results = TrackedField(clamped(1, 20))
+
     KEY_DEEP_SEARCH_ENABLED = "deep_search.enabled"
     KEY_EXA_API_KEY = "deep_search.exa_api_key"  # Fallback for non-keyring
     KEY_FIRECRAWL_API_KEY = "deep_search.firecrawl_api_key"  # Fallback
@@ -27,135 +51,97 @@ class DeepSearchSettings(QObject):
         database: Optional[Database] = None,
         keyring_service: Optional[KeyringService] = None,
         parent: Optional[QObject] = None,
+        change_sink: Optional[Callable[[], None]] = None,
     ):
         super().__init__(parent)
-        self._db = database or Database()
-        self._repo = SettingsRepository(self._db)
+        self._change_sink = change_sink
+        self._unsaved_changes = False
+        self._db = database or get_shared_database()
+        self._repo = get_shared_settings_repository(self._db)
         self._keyring = keyring_service or get_keyring_service()
 
         # Internal state
         self._deep_search_enabled: bool = False
         self._exa_api_key: str = ""
         self._firecrawl_api_key: str = ""
+        # Keyring values as last read or written, so saves skip unchanged keys
+        self._exa_api_key_loaded: str = ""
+        self._firecrawl_api_key_loaded: str = ""
         self._search_provider: str = "exa"
         self._deep_search_num_results: int = 5
 
-    @property
-    def deep_search_enabled(self) -> bool:
-        """Get deep search enabled state."""
-        return self._deep_search_enabled
-
-    @deep_search_enabled.setter
-    def deep_search_enabled(self, value: bool) -> None:
-        """Set deep search enabled state."""
-        value = bool(value)
-        if self._deep_search_enabled != value:
-            self._deep_search_enabled = value
-            self.deep_search_toggled.emit(value)
-            self.settings_changed.emit()
-
-    @property
-    def exa_api_key(self) -> str:
-        """Get Exa API key."""
-        return self._exa_api_key
-
-    @exa_api_key.setter
-    def exa_api_key(self, value: str) -> None:
-        """Set Exa API key."""
-        value = value or ""
-        if self._exa_api_key != value:
-            self._exa_api_key = value
-            self.settings_changed.emit()
-
-    @property
-    def firecrawl_api_key(self) -> str:
-        """Get Firecrawl API key."""
-        return self._firecrawl_api_key
-
-    @firecrawl_api_key.setter
-    def firecrawl_api_key(self, value: str) -> None:
-        """Set Firecrawl API key."""
-        value = value or ""
-        if self._firecrawl_api_key != value:
-            self._firecrawl_api_key = value
-            self.settings_changed.emit()
-
-    @property
-    def search_provider(self) -> str:
-        """Get search provider (exa or firecrawl)."""
-        return self._search_provider
-
-    @search_provider.setter
-    def search_provider(self, value: str) -> None:
-        """Set search provider."""
-        value = value if value in ("exa", "firecrawl") else "exa"
-        if self._search_provider != value:
-            self._search_provider = value
-            self.settings_changed.emit()
-
-    @property
-    def deep_search_num_results(self) -> int:
-        """Get number of search results."""
-        return self._deep_search_num_results
-
-    @deep_search_num_results.setter
-    def deep_search_num_results(self, value: int) -> None:
-        """Set number of search results, clamped to 1-20."""
-        value = max(1, min(20, int(value)))
-        if self._deep_search_num_results != value:
-            self._deep_search_num_results = value
-            self.settings_changed.emit()
-
     def load(self) -> None:
         """Load deep search settings from database and keyring."""
+        # One query for every key, including the non-keyring fallbacks
+        values = self._repo.get_values(
+            (
+                self.KEY_DEEP_SEARCH_ENABLED,
+                self.KEY_SEARCH_PROVIDER,
+                self.KEY_DEEP_SEARCH_NUM_RESULTS,
+                self.KEY_EXA_API_KEY,
+                self.KEY_FIRECRAWL_API_KEY,
+            )
+        )
+
         # Load API keys from keyring, with fallback to SQLite
         self._exa_api_key = self._keyring.get_credential("exa") or ""
         self._firecrawl_api_key = self._keyring.get_credential("firecrawl") or ""
+        self._exa_api_key_loaded = self._exa_api_key
+        self._firecrawl_api_key_loaded = self._firecrawl_api_key
 
         if not self._keyring.is_available:
             if not self._exa_api_key:
-                self._exa_api_key = self._repo.get_value(self.KEY_EXA_API_KEY, "")
+                self._exa_api_key = values.get(self.KEY_EXA_API_KEY, "")
             if not self._firecrawl_api_key:
-                self._firecrawl_api_key = self._repo.get_value(
-                    self.KEY_FIRECRAWL_API_KEY, ""
-                )
+                self._firecrawl_api_key = values.get(self.KEY_FIRECRAWL_API_KEY, "")
 
         # Load non-secret settings from database
-        self._deep_search_enabled = self._repo.get_bool(
-            self.KEY_DEEP_SEARCH_ENABLED, False
+        self._deep_search_enabled = self._repo.parse_bool(
+            values.get(self.KEY_DEEP_SEARCH_ENABLED), False
         )
-        self._search_provider = self._repo.get_value(self.KEY_SEARCH_PROVIDER, "exa")
-        self._deep_search_num_results = self._repo.get_int(
-            self.KEY_DEEP_SEARCH_NUM_RESULTS, 5
+        self._search_provider = values.get(self.KEY_SEARCH_PROVIDER, "exa")
+        self._deep_search_num_results = self._repo.parse_int(
+            values.get(self.KEY_DEEP_SEARCH_NUM_RESULTS), 5
         )
+        self._unsaved_changes = False
 
     def save(self) -> None:
         """Save deep search settings to database and keyring."""
+        if not self._unsaved_changes:
+            return
+        rows = [
+            (self.KEY_DEEP_SEARCH_ENABLED, self._deep_search_enabled, "deep_search"),
+            (self.KEY_SEARCH_PROVIDER, self._search_provider, "deep_search"),
+            (
+                self.KEY_DEEP_SEARCH_NUM_RESULTS,
+                self._deep_search_num_results,
+                "deep_search",
+            ),
+        ]
         # Store API keys in keyring when available; fallback to SQLite
+        pending = False
         if self._keyring.is_available:
-            if self._exa_api_key:
-                self._keyring.store_credential("exa", self._exa_api_key)
-            if self._firecrawl_api_key:
-                self._keyring.store_credential("firecrawl", self._firecrawl_api_key)
+            exa_key = self._exa_api_key
+            if exa_key and exa_key != self._exa_api_key_loaded:
+                if self._keyring.store_credential("exa", exa_key):
+                    self._exa_api_key_loaded = exa_key
+                else:
+                    pending = True
+            firecrawl_key = self._firecrawl_api_key
+            if firecrawl_key and firecrawl_key != self._firecrawl_api_key_loaded:
+                if self._keyring.store_credential("firecrawl", firecrawl_key):
+                    self._firecrawl_api_key_loaded = firecrawl_key
+                else:
+                    pending = True
         else:
             # Fallback to plaintext SQLite storage (security warning in CODE_REVIEW.md)
-            self._repo.set(self.KEY_EXA_API_KEY, self._exa_api_key, "deep_search")
-            self._repo.set(
-                self.KEY_FIRECRAWL_API_KEY, self._firecrawl_api_key, "deep_search"
+            rows.append((self.KEY_EXA_API_KEY, self._exa_api_key, "deep_search"))
+            rows.append(
+                (self.KEY_FIRECRAWL_API_KEY, self._firecrawl_api_key, "deep_search")
             )
-
-        # Save non-secret settings
-        self._repo.set(
-            self.KEY_DEEP_SEARCH_ENABLED,
-            str(self._deep_search_enabled).lower(),
-            "deep_search",
-        )
-        self._repo.set(self.KEY_SEARCH_PROVIDER, self._search_provider, "deep_search")
-        self._repo.set(
-            self.KEY_DEEP_SEARCH_NUM_RESULTS,
-            str(self._deep_search_num_results),
-            "deep_search",
-        )
+        self._repo.set_many(rows)
+        # A failed keyring write stays unsaved so the next save retries it
+        self._unsaved_changes = pending
 
     def snapshot(self) -> dict[str, object]:
         """Create snapshot of current state for revert functionality."""
@@ -169,6 +155,7 @@ class DeepSearchSettings(QObject):
 
     def restore_snapshot(self, snapshot: dict[str, object]) -> None:
         """Restore state from snapshot, emitting signals for changes."""
+        previous = self.snapshot()
         self._deep_search_enabled = bool(snapshot.get("deep_search_enabled", False))
         self._exa_api_key = snapshot.get("exa_api_key", "") or ""
         self._firecrawl_api_key = snapshot.get("firecrawl_api_key", "") or ""
@@ -176,5 +163,23 @@ class DeepSearchSettings(QObject):
         self._deep_search_num_results = int(snapshot.get("deep_search_num_results", 5))
 
         # Emit signals to notify changes
-        self.deep_search_toggled.emit(self._deep_search_enabled)
+        if self._deep_search_enabled != previous["deep_search_enabled"]:
+            self.deep_search_toggled.emit(self._deep_search_enabled)
+        if self.snapshot() != previous:
+            self._notify_changed()
+
+    def _notify_changed(self) -> None:
+        """Report a change to the owner's change sink, then emit settings_changed."""
+        self._unsaved_changes = True
+        if self._change_sink is not None:
+            self._change_sink()
         self.settings_changed.emit()
+
+    @property
+    def has_unsaved_changes(self) -> bool:
+        """Whether changes since the last load or save are not yet persisted."""
+        return self._unsaved_changes
+
+    def mark_unsaved(self) -> None:
+        """Flag the current state as not persisted, e.g. after a rolled-back save."""
+        self._unsaved_changes = True
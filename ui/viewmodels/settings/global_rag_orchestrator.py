@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+from functools import cached_property
+from pathlib import Path
 from typing import Optional, TYPE_CHECKING
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
 
-from core.constants import DEFAULT_EMBEDDING_MODEL
-from core.persistence import Database, RagRepository
+from core.persistence import Database, RagRepository, get_shared_database
 from core.persistence.rag_repository import GLOBAL_WORKSPACE_ID
 from core.services import GlobalRagService, GlobalRagIndexRequest, PdfWatcherService
 
@@ -29,6 +31,9 @@ class GlobalRAGOrchestrator(QObject):
     global_rag_error = Signal(str)
     global_rag_registry_updated = Signal()
 
+    # Quiet period before watcher detections are handed to the indexing service
+    INDEX_DEBOUNCE_MS = 250
+
     def __init__(
         self,
         rag_config: "RAGConfigurationSettings",
@@ -40,25 +45,43 @@ class GlobalRAGOrchestrator(QObject):
         super().__init__(parent)
         self._rag_config = rag_config
         self._model_settings = model_settings
-        self._db = database or Database()
+        self._db = database or get_shared_database()
         self._chroma_service = chroma_service
 
-        # Initialize services
+        # The indexing service and folder watcher are built on first use
         self._rag_repository = RagRepository(self._db)
-        self._global_rag_service = GlobalRagService(
-            self._rag_repository, chroma_service, self
-        )
-        self._pdf_watcher_service = PdfWatcherService(self)
 
-        # Wire up signals
-        self._global_rag_service.index_progress.connect(self._on_index_progress)
-        self._global_rag_service.index_complete.connect(self._on_index_complete)
-        self._global_rag_service.index_error.connect(self._on_index_error)
-        self._pdf_watcher_service.new_pdfs_detected.connect(self._on_pdfs_detected)
-        self._pdf_watcher_service.watcher_error.connect(self.global_rag_error.emit)
-
-        # Connect to config changes for monitoring management
-        self._rag_config.settings_changed.connect(self._on_config_changed)
+        # Last request built by _build_request and the inputs it was built from
+        self._request_cache_key: Optional[tuple] = None
+        self._request_cache: Optional[GlobalRagIndexRequest] = None
+
+        # Watcher detections accumulate here and are indexed as one batch
+        self._pending_pdf_paths: set[str] = set()
+        self._index_timer = QTimer(self)
+        self._index_timer.setSingleShot(True)
+        self._index_timer.setInterval(self.INDEX_DEBOUNCE_MS)
+        self._index_timer.timeout.connect(self._flush_pending_pdfs)
+
+    @cached_property
+    def _global_rag_service(self) -> GlobalRagService:
+        """Indexing service, created and wired on first use."""
+        service = GlobalRagService(self._rag_repository, self._chroma_service, self)
+        # The service re-emits its worker's signals on this (the owning) thread,
+        # so relays can be direct. Progress is relayed 1:1, so chain the signals
+        # rather than re-emit from a slot.
+        service.index_progress.connect(self.global_rag_progress, Qt.DirectConnection)
+        service.index_complete.connect(self._on_index_complete, Qt.DirectConnection)
+        service.index_error.connect(self._on_index_error, Qt.DirectConnection)
+        return service
+
+    @cached_property
+    def _pdf_watcher_service(self) -> PdfWatcherService:
+        """Folder watcher, created and wired when monitoring first starts."""
+        watcher = PdfWatcherService(self)
+        # The watcher is a child of this object and emits on the same thread
+        watcher.new_pdfs_detected.connect(self._on_pdfs_detected, Qt.DirectConnection)
+        watcher.watcher_error.connect(self.global_rag_error, Qt.DirectConnection)
+        return watcher
 
     def start_global_index(self, force_reindex: bool = False) -> None:
         """Start indexing the global RAG folder."""
@@ -98,61 +121,81 @@ class GlobalRAGOrchestrator(QObject):
 
     def stop_monitoring(self) -> None:
         """Stop monitoring the global folder."""
-        self._pdf_watcher_service.stop()
+        self._index_timer.stop()
+        self._pending_pdf_paths.clear()
+        # A watcher that was never built has nothing to stop
+        if "_pdf_watcher_service" in self.__dict__:
+            self._pdf_watcher_service.stop()
 
     def update_monitoring_state(self) -> None:
         """
         Update monitoring state based on configuration.
 
-        Called when monitoring toggle or folder path changes.
+        Called when monitoring toggle or folder path changes. Restarting the
+        watcher rescans the folder, so it is left alone when it already
+        watches the configured folder.
         """
         if self._rag_config.rag_global_monitoring_enabled:
+            folder = self._rag_config.rag_global_folder
+            watched = self._pdf_watcher_service.folder_path
+            if folder and watched is not None and watched == Path(folder).expanduser():
+                return
             self.start_monitoring()
         else:
             self.stop_monitoring()
 
     def _build_request(self, force_reindex: bool) -> GlobalRagIndexRequest:
-        """Build GlobalRagIndexRequest from current configuration."""
-        return GlobalRagIndexRequest(
+        """Build GlobalRagIndexRequest from current configuration.
+
+        Watcher bursts call this repeatedly with unchanged settings, so the
+        last request is reused while its inputs match.
+        """
+        config = self._rag_config
+        key = (
+            force_reindex,
+            config.rag_chunk_size_chars,
+            config.rag_chunk_overlap_chars,
+            config.effective_embedding_model,
+            config.embeddings_enabled,
+            self._model_settings.api_key or None,
+        )
+        if key == self._request_cache_key and self._request_cache is not None:
+            return self._request_cache
+
+        request = GlobalRagIndexRequest(
             workspace_id=GLOBAL_WORKSPACE_ID,
             pdf_paths=[],
-            chunk_size_chars=self._rag_config.rag_chunk_size_chars,
-            chunk_overlap_chars=self._rag_config.rag_chunk_overlap_chars,
-            embedding_model=self._rag_config.rag_embedding_model or DEFAULT_EMBEDDING_MODEL,
-            embeddings_enabled=self._rag_config.rag_enabled
-            and self._rag_config.rag_k_vec > 0,
+            chunk_size_chars=config.rag_chunk_size_chars,
+            chunk_overlap_chars=config.rag_chunk_overlap_chars,
+            embedding_model=config.effective_embedding_model,
+            embeddings_enabled=config.embeddings_enabled,
             api_key=self._model_settings.api_key or None,
             force_reindex=force_reindex,
         )
-
-    def _on_config_changed(self) -> None:
-        """Handle configuration changes to update monitoring."""
-        # Note: This is called on ANY config change, so we check if monitoring-related
-        # The actual monitoring state update happens when explicitly requested
-        pass
+        self._request_cache_key = key
+        self._request_cache = request
+        return request
 
     def _on_pdfs_detected(self, paths: list[str]) -> None:
-        """Handle new PDFs detected by watcher."""
+        """Queue PDFs detected by the watcher and (re)start the debounce timer."""
         if not paths:
             return
+        self._pending_pdf_paths.update(paths)
+        self._index_timer.start()
 
-        request = self._build_request(force_reindex=False)
-        self._global_rag_service.index_paths(
-            GlobalRagIndexRequest(
-                workspace_id=request.workspace_id,
-                pdf_paths=paths,
-                chunk_size_chars=request.chunk_size_chars,
-                chunk_overlap_chars=request.chunk_overlap_chars,
-                embedding_model=request.embedding_model,
-                embeddings_enabled=request.embeddings_enabled,
-                api_key=request.api_key,
-                force_reindex=False,
-            )
-        )
-
-    def _on_index_progress(self, current: int, total: int, path: str) -> None:
-        """Forward indexing progress signal."""
-        self.global_rag_progress.emit(current, total, path)
+    def _flush_pending_pdfs(self) -> None:
+        """Index every queued PDF with a single index_paths call."""
+        if not self._pending_pdf_paths:
+            return
+        # index_paths rejects requests while a run is active; keep the queue
+        # and try again once the service is idle.
+        if self._global_rag_service.is_busy():
+            self._index_timer.start()
+            return
+        paths = sorted(self._pending_pdf_paths)
+        self._pending_pdf_paths.clear()
+        request = replace(self._build_request(force_reindex=False), pdf_paths=paths)
+        self._global_rag_service.index_paths(request)
 
     def _on_index_complete(self, result: object) -> None:
         """Forward indexing complete signal and update registry."""
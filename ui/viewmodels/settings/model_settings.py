@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 import json
-from typing import Optional
+from typing import Callable, Optional
 
 from PySide6.QtCore import QObject, Signal
 
 from core.constants import DEFAULT_MODEL
 from core.infrastructure.keyring_service import KeyringService, get_keyring_service
-from core.persistence import Database, SettingsRepository
+from core.persistence import (
+    Database,
+    get_shared_database,
+    get_shared_settings_repository,
+)
 
 
-DEFAULT_MODELS = [
+DEFAULT_MODELS: tuple[str, ...] = (
     "anthropic/claude-3.5-sonnet",
     "anthropic/claude-3-opus",
     "anthropic/claude-3-haiku",
@@ -25,9 +29,9 @@ DEFAULT_MODELS = [
     "meta-llama/llama-3.1-8b-instruct",
     "mistralai/mixtral-8x7b-instruct",
     "deepseek/deepseek-chat",
-]
+)
 
-DEFAULT_IMAGE_MODELS = [
+DEFAULT_IMAGE_MODELS: tuple[str, ...] = (
     "anthropic/claude-3.5-sonnet",
     "anthropic/claude-3-opus",
     "anthropic/claude-3-haiku",
@@ -36,7 +40,7 @@ DEFAULT_IMAGE_MODELS = [
     "openai/gpt-4-turbo",
     "google/gemini-pro-1.5",
     "google/gemini-flash-1.5",
-]
+)
 
 
 class ModelSettings(QObject):
@@ -50,23 +54,42 @@ class ModelSettings(QObject):
     KEY_IMAGE_MODEL_LIST = "models.image_list"
     KEY_API_KEY = "models.api_key"  # Fallback for non-keyring environments
 
+    # Setting key persisted for each snapshot() field
+    _SNAPSHOT_KEYS = {
+        "api_key": KEY_API_KEY,
+        "default_model": KEY_DEFAULT_MODEL,
+        "image_model": KEY_IMAGE_MODEL,
+        "models": KEY_MODEL_LIST,
+        "image_models": KEY_IMAGE_MODEL_LIST,
+    }
+
     def __init__(
         self,
         database: Optional[Database] = None,
         keyring_service: Optional[KeyringService] = None,
         parent: Optional[QObject] = None,
+        change_sink: Optional[Callable[[], None]] = None,
     ):
         super().__init__(parent)
-        self._db = database or Database()
-        self._repo = SettingsRepository(self._db)
+        self._change_sink = change_sink
+        # Setting keys changed since the last load/save; save() writes only these
+        self._dirty: set[str] = set()
+        self._db = database or get_shared_database()
+        self._repo = get_shared_settings_repository(self._db)
         self._keyring = keyring_service or get_keyring_service()
 
         # Internal state
         self._api_key: str = ""
+        # Keyring value as last read or written, so saves skip an unchanged key
+        self._api_key_loaded: str = ""
         self._default_model: str = DEFAULT_MODEL
         self._image_model: str = DEFAULT_IMAGE_MODELS[0]
-        self._models: list[str] = DEFAULT_MODELS.copy()
-        self._image_models: list[str] = DEFAULT_IMAGE_MODELS.copy()
+        # Immutable, so properties and snapshots share them without copying
+        self._models: tuple[str, ...] = DEFAULT_MODELS
+        self._image_models: tuple[str, ...] = DEFAULT_IMAGE_MODELS
+        # Membership mirrors of the ordered tuples, kept in sync by _sync_model_sets
+        self._models_set: set[str] = set(self._models)
+        self._image_models_set: set[str] = set(self._image_models)
 
     @property
     def keyring_available(self) -> bool:
@@ -89,7 +112,7 @@ class ModelSettings(QObject):
         value = value or ""
         if self._api_key != value:
             self._api_key = value
-            self.settings_changed.emit()
+            self._notify_changed(self.KEY_API_KEY)
 
     @property
     def default_model(self) -> str:
@@ -101,7 +124,7 @@ class ModelSettings(QObject):
         """Set default LLM model."""
         if value and self._default_model != value:
             self._default_model = value
-            self.settings_changed.emit()
+            self._notify_changed(self.KEY_DEFAULT_MODEL)
 
     @property
     def image_model(self) -> str:
@@ -113,87 +136,120 @@ class ModelSettings(QObject):
         """Set image/multimodal model."""
         if value and self._image_model != value:
             self._image_model = value
-            self.settings_changed.emit()
+            self._notify_changed(self.KEY_IMAGE_MODEL)
 
     @property
-    def models(self) -> list[str]:
-        """Get list of available models."""
-        return self._models.copy()
+    def models(self) -> tuple[str, ...]:
+        """Get available models (read-only; use add_model to extend)."""
+        return self._models
 
     def add_model(self, model_id: str) -> None:
         """Add a custom model to the list."""
         model_id = model_id.strip()
-        if not model_id or model_id in self._models:
+        if not model_id or model_id in self._models_set:
             return
-        self._models.append(model_id)
-        self.settings_changed.emit()
+        self._models = (*self._models, model_id)
+        self._models_set.add(model_id)
+        self._notify_changed(self.KEY_MODEL_LIST)
 
     @property
-    def image_models(self) -> list[str]:
-        """Get list of available image models."""
-        return self._image_models.copy()
+    def image_models(self) -> tuple[str, ...]:
+        """Get available image models (read-only; use add_image_model to extend)."""
+        return self._image_models
 
     def add_image_model(self, model_id: str) -> None:
         """Add a custom image model to the list."""
         model_id = model_id.strip()
-        if not model_id or model_id in self._image_models:
+        if not model_id or model_id in self._image_models_set:
             return
-        self._image_models.append(model_id)
-        self.settings_changed.emit()
+        self._image_models = (*self._image_models, model_id)
+        self._image_models_set.add(model_id)
+        self._notify_changed(self.KEY_IMAGE_MODEL_LIST)
 
     def load(self) -> None:
         """Load model settings from database and keyring."""
-        # Load model configuration from database
-        self._default_model = self._repo.get_value(self.KEY_DEFAULT_MODEL, DEFAULT_MODEL)
-        self._image_model = self._repo.get_value(
-            self.KEY_IMAGE_MODEL, DEFAULT_IMAGE_MODELS[0]
+        # One query for every key, including the non-keyring API key fallback
+        values = self._repo.get_values(
+            (
+                self.KEY_DEFAULT_MODEL,
+                self.KEY_IMAGE_MODEL,
+                self.KEY_API_KEY,
+                self.KEY_MODEL_LIST,
+                self.KEY_IMAGE_MODEL_LIST,
+            )
         )
 
+        # Load model configuration from database
+        self._default_model = values.get(self.KEY_DEFAULT_MODEL, DEFAULT_MODEL)
+        self._image_model = values.get(self.KEY_IMAGE_MODEL, DEFAULT_IMAGE_MODELS[0])
+
         # Load API key from keyring, with fallback to SQLite when keyring is unavailable
         self._api_key = self._keyring.get_credential("openrouter") or ""
+        self._api_key_loaded = self._api_key
         if not self._keyring.is_available and not self._api_key:
-            self._api_key = self._repo.get_value(self.KEY_API_KEY, "")
+            self._api_key = values.get(self.KEY_API_KEY, "")
 
         # Load model lists from JSON
-        model_list = self._repo.get_value(self.KEY_MODEL_LIST, "")
+        model_list = values.get(self.KEY_MODEL_LIST, "")
         if model_list:
             try:
                 parsed = json.loads(model_list)
                 if isinstance(parsed, list) and parsed:
-                    self._models = [str(item) for item in parsed]
+                    self._models = tuple(str(item) for item in parsed)
             except json.JSONDecodeError:
-                self._models = DEFAULT_MODELS.copy()
+                self._models = DEFAULT_MODELS
         else:
-            self._models = DEFAULT_MODELS.copy()
+            self._models = DEFAULT_MODELS
 
-        image_model_list = self._repo.get_value(self.KEY_IMAGE_MODEL_LIST, "")
+        image_model_list = values.get(self.KEY_IMAGE_MODEL_LIST, "")
         if image_model_list:
             try:
                 parsed = json.loads(image_model_list)
                 if isinstance(parsed, list) and parsed:
-                    self._image_models = [str(item) for item in parsed]
+                    self._image_models = tuple(str(item) for item in parsed)
             except json.JSONDecodeError:
-                self._image_models = DEFAULT_IMAGE_MODELS.copy()
+                self._image_models = DEFAULT_IMAGE_MODELS
         else:
-            self._image_models = DEFAULT_IMAGE_MODELS.copy()
+            self._image_models = DEFAULT_IMAGE_MODELS
+        self._sync_model_sets()
+        self._dirty.clear()
 
     def save(self) -> None:
-        """Save model settings to database and keyring."""
-        # Store API key in keyring when available; fallback to SQLite in headless mode
-        if self._keyring.is_available:
-            if self._api_key:
-                self._keyring.store_credential("openrouter", self._api_key)
-        else:
-            # Fallback to plaintext SQLite storage (security warning in CODE_REVIEW.md)
-            self._repo.set(self.KEY_API_KEY, self._api_key, "models")
-
-        # Save model configuration
-        self._repo.set(self.KEY_DEFAULT_MODEL, self._default_model, "models")
-        self._repo.set(self.KEY_IMAGE_MODEL, self._image_model, "models")
-        self._repo.set(self.KEY_MODEL_LIST, json.dumps(self._models), "models")
-        self._repo.set(
-            self.KEY_IMAGE_MODEL_LIST, json.dumps(self._image_models), "models"
-        )
+        """Save changed model settings to database and keyring."""
+        dirty = self._dirty
+        if not dirty:
+            return
+        pending: set[str] = set()
+        rows = [
+            (key, value, "models")
+            for key, value in (
+                (self.KEY_DEFAULT_MODEL, self._default_model),
+                (self.KEY_IMAGE_MODEL, self._image_model),
+            )
+            if key in dirty
+        ]
+        # Model lists are only re-serialized when they changed
+        if self.KEY_MODEL_LIST in dirty:
+            rows.append((self.KEY_MODEL_LIST, json.dumps(self._models), "models"))
+        if self.KEY_IMAGE_MODEL_LIST in dirty:
+            rows.append(
+                (self.KEY_IMAGE_MODEL_LIST, json.dumps(self._image_models), "models")
+            )
+        if self.KEY_API_KEY in dirty:
+            # Store API key in keyring when available; fallback to SQLite in headless mode
+            if self._keyring.is_available:
+                if self._api_key and self._api_key != self._api_key_loaded:
+                    if self._keyring.store_credential("openrouter", self._api_key):
+                        self._api_key_loaded = self._api_key
+                    else:
+                        pending.add(self.KEY_API_KEY)
+            else:
+                # Fallback to plaintext SQLite storage (security warning in CODE_REVIEW.md)
+                rows.append((self.KEY_API_KEY, self._api_key, "models"))
+        if rows:
+            self._repo.set_many(rows)
+        # A failed keyring write stays dirty so the next save retries it
+        dirty.intersection_update(pending)
 
     def snapshot(self) -> dict[str, object]:
         """Create snapshot of current state for revert functionality."""
@@ -201,17 +257,45 @@ class ModelSettings(QObject):
             "api_key": self._api_key,
             "default_model": self._default_model,
             "image_model": self._image_model,
-            "models": self._models.copy(),
-            "image_models": self._image_models.copy(),
+            "models": self._models,
+            "image_models": self._image_models,
         }
 
     def restore_snapshot(self, snapshot: dict[str, object]) -> None:
         """Restore state from snapshot, emitting signals for changes."""
+        previous = self.snapshot()
         self._api_key = snapshot.get("api_key", "") or ""
         self._default_model = snapshot.get("default_model", DEFAULT_MODEL)
         self._image_model = snapshot.get("image_model", DEFAULT_IMAGE_MODELS[0])
-        self._models = list(snapshot.get("models", DEFAULT_MODELS.copy()))
-        self._image_models = list(
-            snapshot.get("image_models", DEFAULT_IMAGE_MODELS.copy())
-        )
+        self._models = tuple(snapshot.get("models", DEFAULT_MODELS))
+        self._image_models = tuple(snapshot.get("image_models", DEFAULT_IMAGE_MODELS))
+        self._sync_model_sets()
+        current = self.snapshot()
+        changed = [
+            self._SNAPSHOT_KEYS[field]
+            for field, value in current.items()
+            if previous[field] != value
+        ]
+        if changed:
+            self._notify_changed(*changed)
+
+    def _sync_model_sets(self) -> None:
+        """Rebuild the membership sets after the model tuples are replaced."""
+        self._models_set = set(self._models)
+        self._image_models_set = set(self._image_models)
+
+    def _notify_changed(self, *keys: str) -> None:
+        """Record the changed keys, report to the change sink, then emit settings_changed."""
+        self._dirty.update(keys)
+        if self._change_sink is not None:
+            self._change_sink()
         self.settings_changed.emit()
+
+    @property
+    def has_unsaved_changes(self) -> bool:
+        """Whether changes since the last load or save are not yet persisted."""
+        return bool(self._dirty)
+
+    def mark_unsaved(self) -> None:
+        """Flag the current state as not persisted, e.g. after a rolled-back save."""
+        self._dirty.update(self._SNAPSHOT_KEYS.values())
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import json
-from typing import Optional
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
 
 from PySide6.QtCore import QObject, Signal
 
 from core.models import ShortcutDefinition
-from core.persistence import Database, SettingsRepository
+from core.persistence import (
+    Database,
+    get_shared_database,
+    get_shared_settings_repository,
+)
 
 
 DEFAULT_SHORTCUT_DEFINITIONS = [
@@ -61,6 +66,13 @@ DEFAULT_SHORTCUT_BINDINGS = {
     for definition in DEFAULT_SHORTCUT_DEFINITIONS
 }
 
+# Shared by every shortcut_definitions read; the definitions never change
+_SHORTCUT_DEFINITIONS = tuple(DEFAULT_SHORTCUT_DEFINITIONS)
+
+# Precomputed from the definitions for validation and normalization
+_VALID_ACTION_IDS = frozenset(DEFAULT_SHORTCUT_BINDINGS)
+_DEFAULT_BINDING_ITEMS = tuple(DEFAULT_SHORTCUT_BINDINGS.items())
+
 
 class ShortcutsSettings(QObject):
     """Manages keyboard shortcut bindings."""
@@ -74,23 +86,26 @@ class ShortcutsSettings(QObject):
         self,
         database: Optional[Database] = None,
         parent: Optional[QObject] = None,
+        change_sink: Optional[Callable[[], None]] = None,
     ):
         super().__init__(parent)
-        self._db = database or Database()
-        self._repo = SettingsRepository(self._db)
+        self._change_sink = change_sink
+        self._unsaved_changes = False
+        self._db = database or get_shared_database()
+        self._repo = get_shared_settings_repository(self._db)
 
         # Internal state
         self._shortcut_bindings: dict[str, str] = DEFAULT_SHORTCUT_BINDINGS.copy()
 
     @property
-    def shortcut_definitions(self) -> list[ShortcutDefinition]:
-        """Get list of available shortcut definitions."""
-        return DEFAULT_SHORTCUT_DEFINITIONS.copy()
+    def shortcut_definitions(self) -> tuple[ShortcutDefinition, ...]:
+        """Get available shortcut definitions."""
+        return _SHORTCUT_DEFINITIONS
 
     @property
-    def shortcut_bindings(self) -> dict[str, str]:
-        """Get current shortcut bindings."""
-        return self._shortcut_bindings.copy()
+    def shortcut_bindings(self) -> Mapping[str, str]:
+        """Get a read-only view of the shortcut bindings as of this call."""
+        return MappingProxyType(self._shortcut_bindings)
 
     def get_shortcut_sequence(self, action_id: str) -> str:
         """Get key sequence for a specific action."""
@@ -98,24 +113,29 @@ class ShortcutsSettings(QObject):
 
     def set_shortcut_sequence(self, action_id: str, sequence: str) -> None:
         """Set key sequence for a specific action."""
-        if action_id not in DEFAULT_SHORTCUT_BINDINGS:
+        if action_id not in _VALID_ACTION_IDS:
             return
 
         cleaned = (sequence or "").strip()
         if self._shortcut_bindings.get(action_id, "") != cleaned:
-            self._shortcut_bindings[action_id] = cleaned
+            # Copy on write: views handed out earlier keep the old bindings
+            self._shortcut_bindings = {**self._shortcut_bindings, action_id: cleaned}
             self.shortcuts_changed.emit()
-            self.settings_changed.emit()
+            self._notify_changed()
 
     def reset_shortcuts(self) -> None:
         """Reset all shortcuts to default values."""
+        if self._shortcut_bindings == DEFAULT_SHORTCUT_BINDINGS:
+            return
         self._shortcut_bindings = DEFAULT_SHORTCUT_BINDINGS.copy()
         self.shortcuts_changed.emit()
-        self.settings_changed.emit()
+        self._notify_changed()
 
     def load(self) -> None:
         """Load shortcuts from database."""
-        shortcut_data = self._repo.get_value(self.KEY_SHORTCUT_BINDINGS, "")
+        # get_values() reads the bare value without building a Setting row
+        values = self._repo.get_values((self.KEY_SHORTCUT_BINDINGS,))
+        shortcut_data = values.get(self.KEY_SHORTCUT_BINDINGS, "")
         if shortcut_data:
             try:
                 parsed_shortcuts = json.loads(shortcut_data)
@@ -129,14 +149,18 @@ class ShortcutsSettings(QObject):
                 self._shortcut_bindings = DEFAULT_SHORTCUT_BINDINGS.copy()
         else:
             self._shortcut_bindings = DEFAULT_SHORTCUT_BINDINGS.copy()
+        self._unsaved_changes = False
 
     def save(self) -> None:
         """Save shortcuts to database."""
+        if not self._unsaved_changes:
+            return
         self._repo.set(
             self.KEY_SHORTCUT_BINDINGS,
             json.dumps(self._shortcut_bindings),
             "shortcuts",
         )
+        self._unsaved_changes = False
 
     def snapshot(self) -> dict[str, object]:
         """Create snapshot of current state for revert functionality."""
@@ -146,24 +170,42 @@ class ShortcutsSettings(QObject):
 
     def restore_snapshot(self, snapshot: dict[str, object]) -> None:
         """Restore state from snapshot, emitting signals for changes."""
+        previous = self._shortcut_bindings
         shortcuts = snapshot.get("shortcut_bindings", DEFAULT_SHORTCUT_BINDINGS.copy())
         if isinstance(shortcuts, dict):
             self._shortcut_bindings = self._normalize_shortcut_bindings(shortcuts)
         else:
             self._shortcut_bindings = DEFAULT_SHORTCUT_BINDINGS.copy()
 
-        self.shortcuts_changed.emit()
-        self.settings_changed.emit()
+        if self._shortcut_bindings != previous:
+            self.shortcuts_changed.emit()
+            self._notify_changed()
 
     def _normalize_shortcut_bindings(
         self, bindings: dict[str, object]
     ) -> dict[str, str]:
         """Normalize and validate shortcut bindings."""
+        get = bindings.get
         normalized: dict[str, str] = {}
-        for definition in DEFAULT_SHORTCUT_DEFINITIONS:
-            value = bindings.get(definition.action_id)
-            if isinstance(value, str):
-                normalized[definition.action_id] = value.strip()
-            else:
-                normalized[definition.action_id] = definition.default_sequence
+        for action_id, default_sequence in _DEFAULT_BINDING_ITEMS:
+            value = get(action_id)
+            normalized[action_id] = (
+                value.strip() if isinstance(value, str) else default_sequence
+            )
         return normalized
+
+    def _notify_changed(self) -> None:
+        """Report a change to the owner's change sink, then emit settings_changed."""
+        self._unsaved_changes = True
+        if self._change_sink is not None:
+            self._change_sink()
+        self.settings_changed.emit()
+
+    @property
+    def has_unsaved_changes(self) -> bool:
+        """Whether changes since the last load or save are not yet persisted."""
+        return self._unsaved_changes
+
+    def mark_unsaved(self) -> None:
+        """Flag the current state as not persisted, e.g. after a rolled-back save."""
+        self._unsaved_changes = True
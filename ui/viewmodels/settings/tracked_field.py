@@ -0,0 +1,57 @@
+"""TrackedField - Descriptor for settings fields that notify on change."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+
+def clamped(low: int, high: int) -> Callable[[Any], int]:
+    """Build a normalizer that converts to int and clamps to [low, high]."""
+
+    def clamp(value: Any) -> int:
+        return max(low, min(high, int(value)))
+
+    return clamp
+
+
+def stripped(value: Any) -> str:
+    """Normalize an optional string by stripping surrounding whitespace."""
+    return (value or "").strip()
+
+
+class TrackedField:
+    """Descriptor for a normalized setting that notifies its owner on change.
+
+    Reads return the ``_<name>`` backing attribute. Writes normalize the value
+    and, only if it differs, store it, emit the optional extra signal with the
+    new value, and call the owner's ``_notify_changed()``.
+    """
+
+    __slots__ = ("_normalize", "_extra_signal", "_attr")
+
+    def __init__(
+        self,
+        normalize: Callable[[Any], Any],
+        *,
+        extra_signal: Optional[str] = None,
+    ):
+        self._normalize = normalize
+        self._extra_signal = extra_signal
+        self._attr = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj, self._attr)
+
+    def __set__(self, obj, value) -> None:
+        value = self._normalize(value)
+        if getattr(obj, self._attr) == value:
+            return
+        setattr(obj, self._attr, value)
+        if self._extra_signal is not None:
+            getattr(obj, self._extra_signal).emit(value)
+        obj._notify_changed()
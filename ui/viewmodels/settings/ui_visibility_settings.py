@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Optional
 
 from PySide6.QtCore import QObject, Signal
 
-from core.persistence import Database, SettingsRepository
+from core.persistence import (
+    Database,
+    get_shared_database,
+    get_shared_settings_repository,
+)
 
 
 class UIVisibilitySettings(QObject):
@@ -21,10 +25,13 @@ class UIVisibilitySettings(QObject):
         self,
         database: Optional[Database] = None,
         parent: Optional[QObject] = None,
+        change_sink: Optional[Callable[[], None]] = None,
     ):
         super().__init__(parent)
-        self._db = database or Database()
-        self._repo = SettingsRepository(self._db)
+        self._change_sink = change_sink
+        self._unsaved_changes = False
+        self._db = database or get_shared_database()
+        self._repo = get_shared_settings_repository(self._db)
 
         # Internal state
         self._sidebar_visible: bool = True
@@ -41,7 +48,7 @@ class UIVisibilitySettings(QObject):
         value = bool(value)
         if self._sidebar_visible != value:
             self._sidebar_visible = value
-            self.settings_changed.emit()
+            self._notify_changed()
 
     @property
     def artifact_panel_visible(self) -> bool:
@@ -54,27 +61,32 @@ class UIVisibilitySettings(QObject):
         value = bool(value)
         if self._artifact_panel_visible != value:
             self._artifact_panel_visible = value
-            self.settings_changed.emit()
+            self._notify_changed()
 
     def load(self) -> None:
         """Load UI visibility settings from database."""
-        self._sidebar_visible = self._repo.get_bool(self.KEY_SIDEBAR_VISIBLE, True)
-        self._artifact_panel_visible = self._repo.get_bool(
-            self.KEY_ARTIFACT_PANEL_VISIBLE, False
+        values = self._repo.get_values(
+            (self.KEY_SIDEBAR_VISIBLE, self.KEY_ARTIFACT_PANEL_VISIBLE)
         )
+        self._sidebar_visible = self._repo.parse_bool(
+            values.get(self.KEY_SIDEBAR_VISIBLE), True
+        )
+        self._artifact_panel_visible = self._repo.parse_bool(
+            values.get(self.KEY_ARTIFACT_PANEL_VISIBLE), False
+        )
+        self._unsaved_changes = False
 
     def save(self) -> None:
         """Save UI visibility settings to database."""
-        self._repo.set(
-            self.KEY_SIDEBAR_VISIBLE,
-            str(self._sidebar_visible).lower(),
-            "ui",
-        )
-        self._repo.set(
-            self.KEY_ARTIFACT_PANEL_VISIBLE,
-            str(self._artifact_panel_visible).lower(),
-            "ui",
+        if not self._unsaved_changes:
+            return
+        self._repo.set_many(
+            [
+                (self.KEY_SIDEBAR_VISIBLE, self._sidebar_visible, "ui"),
+                (self.KEY_ARTIFACT_PANEL_VISIBLE, self._artifact_panel_visible, "ui"),
+            ]
         )
+        self._unsaved_changes = False
 
     def snapshot(self) -> dict[str, object]:
         """Create snapshot of current state for revert functionality."""
@@ -85,8 +97,26 @@ class UIVisibilitySettings(QObject):
 
     def restore_snapshot(self, snapshot: dict[str, object]) -> None:
         """Restore state from snapshot, emitting signals for changes."""
+        previous = self.snapshot()
         self._sidebar_visible = bool(snapshot.get("sidebar_visible", True))
         self._artifact_panel_visible = bool(
             snapshot.get("artifact_panel_visible", False)
         )
+        if self.snapshot() != previous:
+            self._notify_changed()
+
+    def _notify_changed(self) -> None:
+        """Report a change to the owner's change sink, then emit settings_changed."""
+        self._unsaved_changes = True
+        if self._change_sink is not None:
+            self._change_sink()
         self.settings_changed.emit()
+
+    @property
+    def has_unsaved_changes(self) -> bool:
+        """Whether changes since the last load or save are not yet persisted."""
+        return self._unsaved_changes
+
+    def mark_unsaved(self) -> None:
+        """Flag the current state as not persisted, e.g. after a rolled-back save."""
+        self._unsaved_changes = True
@@ -92,9 +92,18 @@ class WorkspaceViewModel(QObject):
         session = self._session_repository.get_by_id(session_id)
         if session is None:
             return
+        self.activate_session(session)
+
+    def activate_session(self, session: Session) -> None:
+        """Make an already-loaded session current without re-fetching it."""
         self._current_session = session
         self.current_session_changed.emit()
 
+    def bootstrap(self) -> tuple[int, Optional[Session]]:
+        """Return (workspace count, first session of current workspace) from loaded state."""
+        first_session = self._sessions[0] if self._sessions else None
+        return len(self._workspaces), first_session
+
     @Slot(str)
     def create_workspace(self, name: str) -> None:
         if not name.strip():
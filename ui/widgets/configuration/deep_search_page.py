@@ -29,7 +29,8 @@ class DeepSearchPage(QWidget):
         parent: Optional[QWidget] = None,
     ):
         super().__init__(parent)
-        self._viewmodel = viewmodel
+        # Bind to the subsystem directly; these setters run on every keystroke
+        self._settings = viewmodel.deep_search
         self._setup_ui()
         self._load_values()
         self._connect_signals()
@@ -158,12 +159,12 @@ class DeepSearchPage(QWidget):
         layout.addStretch()
 
     def _load_values(self) -> None:
-        self._enabled_check.setChecked(self._viewmodel.deep_search_enabled)
-        self._exa_key_input.setText(self._viewmodel.exa_api_key)
-        self._firecrawl_key_input.setText(self._viewmodel.firecrawl_api_key)
-        self._num_results_spin.setValue(self._viewmodel.deep_search_num_results)
+        self._enabled_check.setChecked(self._settings.deep_search_enabled)
+        self._exa_key_input.setText(self._settings.exa_api_key)
+        self._firecrawl_key_input.setText(self._settings.firecrawl_api_key)
+        self._num_results_spin.setValue(self._settings.deep_search_num_results)
         
-        if self._viewmodel.search_provider == "firecrawl":
+        if self._settings.search_provider == "firecrawl":
             self._firecrawl_radio.setChecked(True)
         else:
             self._exa_radio.setChecked(True)
@@ -176,19 +177,19 @@ class DeepSearchPage(QWidget):
         self._provider_group.buttonClicked.connect(self._on_provider_changed)
 
     def _on_enabled_changed(self, checked: bool) -> None:
-        self._viewmodel.deep_search_enabled = checked
+        self._settings.deep_search_enabled = checked
 
     def _on_exa_key_changed(self, text: str) -> None:
-        self._viewmodel.exa_api_key = text
+        self._settings.exa_api_key = text
 
     def _on_firecrawl_key_changed(self, text: str) -> None:
-        self._viewmodel.firecrawl_api_key = text
+        self._settings.firecrawl_api_key = text
 
     def _on_num_results_changed(self, value: int) -> None:
-        self._viewmodel.deep_search_num_results = value
+        self._settings.deep_search_num_results = value
 
     def _on_provider_changed(self) -> None:
         if self._firecrawl_radio.isChecked():
-            self._viewmodel.search_provider = "firecrawl"
+            self._settings.search_provider = "firecrawl"
         else:
-            self._viewmodel.search_provider = "exa"
+            self._settings.search_provider = "exa"
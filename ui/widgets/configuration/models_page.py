@@ -29,7 +29,8 @@ class ModelsPage(QWidget):
         parent: Optional[QWidget] = None,
     ):
         super().__init__(parent)
-        self._viewmodel = viewmodel
+        # Bind to the subsystem directly; the API key setter runs on every keystroke
+        self._models = viewmodel.models
         self._api_key_visible = False
         self._setup_ui()
         self._load_values()
@@ -147,8 +148,8 @@ class ModelsPage(QWidget):
         layout.addStretch()
 
     def _load_values(self) -> None:
-        if self._viewmodel.api_key:
-            self._api_key_input.setText(self._viewmodel.api_key)
+        if self._models.api_key:
+            self._api_key_input.setText(self._models.api_key)
         self._refresh_default_combo()
         self._refresh_image_model_combo()
         
@@ -157,19 +158,19 @@ class ModelsPage(QWidget):
 
     def _refresh_default_combo(self) -> None:
         self._default_model_combo.clear()
-        for model in self._viewmodel.models_list:
+        for model in self._models.models:
             self._default_model_combo.addItem(model)
 
-        index = self._default_model_combo.findText(self._viewmodel.default_model)
+        index = self._default_model_combo.findText(self._models.default_model)
         if index >= 0:
             self._default_model_combo.setCurrentIndex(index)
 
     def _refresh_image_model_combo(self) -> None:
         self._image_model_combo.clear()
-        for model in self._viewmodel.image_models_list:
+        for model in self._models.image_models:
             self._image_model_combo.addItem(model)
 
-        index = self._image_model_combo.findText(self._viewmodel.image_model)
+        index = self._image_model_combo.findText(self._models.image_model)
         if index >= 0:
             self._image_model_combo.setCurrentIndex(index)
 
@@ -182,7 +183,7 @@ class ModelsPage(QWidget):
         self._add_image_model_btn.clicked.connect(self._on_add_image_model)
 
     def _on_api_key_changed(self, text: str) -> None:
-        self._viewmodel.api_key = text
+        self._models.api_key = text
 
     def _toggle_api_visibility(self) -> None:
         self._api_key_visible = not self._api_key_visible
@@ -195,22 +196,22 @@ class ModelsPage(QWidget):
 
     def _on_default_model_changed(self, text: str) -> None:
         if text:
-            self._viewmodel.default_model = text
+            self._models.default_model = text
 
     def _on_image_model_changed(self, text: str) -> None:
         if text:
-            self._viewmodel.image_model = text
+            self._models.image_model = text
 
     def _on_add_model(self) -> None:
         model = self._add_model_input.text().strip()
         if model:
-            self._viewmodel.add_model(model)
+            self._models.add_model(model)
             self._add_model_input.clear()
             self._refresh_default_combo()
 
     def _on_add_image_model(self) -> None:
         model = self._add_image_model_input.text().strip()
         if model:
-            self._viewmodel.add_image_model(model)
+            self._models.add_image_model(model)
             self._add_image_model_input.clear()
             self._refresh_image_model_combo()